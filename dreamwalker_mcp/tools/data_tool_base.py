@@ -7,13 +7,24 @@ ToolRegistry with consistent schemas and error handling.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import concurrent.futures
+import threading
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from config import ConfigManager
 from data_fetching.factory import DataFetchingFactory
 
 from .module_base import ToolModuleBase
 
+# Data clients keyed by (source_name, api_key). Clients hold a requests.Session,
+# so sharing them keeps connections alive across tool instances.
+_SHARED_CLIENTS: Dict[Tuple[str, Optional[str]], Any] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+# Upper bound on threads used by one _run_parallel() bundle
+_MAX_PARALLEL_CALLS = 8
+
 
 class DataToolModuleBase(ToolModuleBase):
     """Base class for data source tool modules."""
@@ -33,7 +44,7 @@ class DataToolModuleBase(ToolModuleBase):
         raise NotImplementedError("Subclasses must implement build_schemas()")
 
     def _get_client(self):
-        """Instantiate and memoize the underlying data client."""
+        """Return the data client, shared by every instance using the same source and key."""
         if self._client is not None:
             return self._client
 
@@ -47,14 +58,54 @@ class DataToolModuleBase(ToolModuleBase):
             if api_key:
                 kwargs["api_key"] = api_key
 
-        try:
-            self._client = DataFetchingFactory.create_client(self.source_name, **kwargs)
-        except Exception as exc:  # noqa: BLE001 - surface friendly error message
-            raise RuntimeError(
-                f"Could not initialize data client for '{self.source_name}': {exc}"
-            ) from exc
+        cache_key = (self.source_name, kwargs.get("api_key"))
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(cache_key)
+            if client is None:
+                try:
+                    client = DataFetchingFactory.create_client(self.source_name, **kwargs)
+                except Exception as exc:  # noqa: BLE001 - surface friendly error message
+                    raise RuntimeError(
+                        f"Could not initialize data client for '{self.source_name}': {exc}"
+                    ) from exc
+                _SHARED_CLIENTS[cache_key] = client
+
+        self._client = client
+        return client
+
+    def reset_client(self) -> None:
+        """Drop the memoized client so the next call rebuilds it (e.g. after an API key change)."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        with _SHARED_CLIENTS_LOCK:
+            for key, shared in list(_SHARED_CLIENTS.items()):
+                if shared is client:
+                    del _SHARED_CLIENTS[key]
+
+    @staticmethod
+    def _run_parallel(calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent client calls concurrently and collect results by key.
 
-        return self._client
+        A failing call is reported as {"error": ...} under its key instead of
+        failing the whole bundle.
+        """
+        def run(call: Callable[[], Any]) -> Any:
+            try:
+                return call()
+            except Exception as exc:  # noqa: BLE001 - reported per call
+                return {"error": str(exc)}
+
+        if not calls:
+            return {}
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(calls), _MAX_PARALLEL_CALLS),
+            thread_name_prefix="data"
+        ) as pool:
+            futures = {key: pool.submit(run, call) for key, call in calls.items()}
+            return {key: future.result() for key, future in futures.items()}
 
     @staticmethod
     def _normalize_dataframe(data: Any, limit: Optional[int] = None) -> Any:
@@ -68,23 +119,31 @@ class DataToolModuleBase(ToolModuleBase):
 
     def _apply_record_limit(
         self,
-        records: List[Dict[str, Any]],
+        records: Iterable[Dict[str, Any]],
         limit: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Limit record count to avoid huge responses.
 
+        Lists already within the limit are returned as-is and longer ones are
+        sliced; any other iterable (e.g. a generator from a client) is consumed
+        lazily with ``islice`` so records past the limit are never produced.
+
         Args:
-            records: List of records to trim.
+            records: Records to trim.
             limit: Optional explicit limit. Defaults to self.max_records.
 
         Returns:
             Possibly trimmed record list.
         """
         max_items = limit if limit is not None else self.max_records
+        if isinstance(records, list):
+            if max_items is None or len(records) <= max_items:
+                return records
+            return records[:max_items]
         if max_items is None:
-            return records
-        return records[:max_items]
+            return list(records)
+        return list(islice(records, max_items))
 
 
 __all__ = ["DataToolModuleBase"]
@@ -6,9 +6,102 @@ Exposes ElevenLabs text-to-speech capabilities through the tool registry.
 Author: Luke Steuber
 """
 
-from typing import Dict, Any
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
-from .module_base import ToolModuleBase
+from .module_base import ToolModuleBase, swr_cache
+
+
+logger = logging.getLogger(__name__)
+
+# On-disk cache of synthesized audio, keyed by SHA-256 of the request
+_AUDIO_CACHE_DIR = Path("~/.cache/dreamwalker/tts").expanduser()
+_AUDIO_CACHE_MAX_BYTES = 1 << 30  # 1 GiB, oldest files evicted first
+_AUDIO_FORMAT = "mp3"
+_OUTPUT_FORMAT = "mp3_44100_128"
+
+# Running estimate of the cache size in bytes; None until the first write
+# scans the directory. The directory is only rescanned when the estimate
+# goes over the limit, which also corrects drift from other processes.
+_audio_cache_bytes: Optional[int] = None
+_audio_cache_lock = threading.Lock()
+
+
+def _audio_cache_path(text: str, voice_id: str, model: str) -> Path:
+    """Return the cache file path for a speech request."""
+    key = hashlib.sha256(
+        f"{model}|{voice_id}|{_OUTPUT_FORMAT}|{text}".encode("utf-8")
+    ).hexdigest()
+    return _AUDIO_CACHE_DIR / f"{key}.{_AUDIO_FORMAT}"
+
+
+def _read_cached_audio(path: Path) -> Optional[bytes]:
+    """Read cached audio and mark it recently used; None on a miss."""
+    try:
+        audio = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        os.utime(path)
+    except OSError as e:
+        logger.debug("Could not touch cached TTS audio %s: %s", path, e)
+    return audio
+
+
+def _scan_audio_cache(dirpath: Path) -> Tuple[List[Tuple[float, int, str]], int]:
+    """Return (mtime, size, path) for each cached file, and their total size."""
+    entries = []
+    total = 0
+    for entry in os.scandir(dirpath):
+        if entry.is_file() and entry.name.endswith(f".{_AUDIO_FORMAT}"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    return entries, total
+
+
+def _write_cached_audio(path: Path, audio: bytes) -> None:
+    """Store audio in the cache and evict least recently used files."""
+    global _audio_cache_bytes
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A private temp file per writer, so concurrent identical requests
+        # never rename each other's half-written output into place
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(audio)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        with _audio_cache_lock:
+            if _audio_cache_bytes is None:
+                _, _audio_cache_bytes = _scan_audio_cache(path.parent)
+            else:
+                _audio_cache_bytes += len(audio)
+            if _audio_cache_bytes <= _AUDIO_CACHE_MAX_BYTES:
+                return
+
+            entries, total = _scan_audio_cache(path.parent)
+            if total > _AUDIO_CACHE_MAX_BYTES:
+                for _, size, entry_path in sorted(entries):
+                    try:
+                        os.remove(entry_path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    if total <= _AUDIO_CACHE_MAX_BYTES:
+                        break
+            _audio_cache_bytes = total
+    except OSError as e:
+        logger.warning("Could not cache TTS audio: %s", e)
 
 
 class ElevenLabsTools(ToolModuleBase):
@@ -76,18 +169,37 @@ class ElevenLabsTools(ToolModuleBase):
 
     def generate_speech(self, text: str, voice_id: str = "21m00Tcm4TlvDq8ikWAM",
                        model: str = "eleven_monolingual_v1") -> Dict[str, Any]:
-        """Generate speech from text."""
-        # This will need to be implemented in elevenlabs_provider
-        try:
-            audio_data = self.provider.generate_speech(text=text, voice_id=voice_id, model=model)
+        """Generate speech from text, reusing cached audio for repeat requests."""
+        cache_path = _audio_cache_path(text, voice_id, model)
+        audio_data = _read_cached_audio(cache_path)
+        if audio_data is not None:
             return {
                 "audio_data": audio_data,
-                "format": "mp3",
-                "text_length": len(text)
+                "format": _AUDIO_FORMAT,
+                "text_length": len(text),
+                "cached": True
             }
+
+        # This will need to be implemented in elevenlabs_provider
+        try:
+            response = self.provider.generate_speech(
+                text=text, voice_id=voice_id, model=model, output_format=_OUTPUT_FORMAT
+            )
         except AttributeError:
             return {"error": "ElevenLabs TTS not yet implemented in provider"}
 
+        audio_data = getattr(response, "audio_data", response)
+        if isinstance(audio_data, bytes):
+            _write_cached_audio(cache_path, audio_data)
+
+        return {
+            "audio_data": audio_data,
+            "format": _AUDIO_FORMAT,
+            "text_length": len(text),
+            "cached": False
+        }
+
+    @swr_cache(ttl=3600, stale_ttl=86400)
     def list_voices(self) -> Dict[str, Any]:
         """List available voices."""
         try:
@@ -17,10 +17,20 @@ Usage:
     python example_tool.py --interactive
 """
 
+import operator
 from typing import Dict, Any
 from .module_base import ToolModuleBase
 
 
+# Supported calculator operations
+_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
 class ExampleTool(ToolModuleBase):
     """Example tool module demonstrating the base class pattern."""
 
@@ -111,18 +121,12 @@ class ExampleTool(ToolModuleBase):
         Returns:
             Result dictionary with calculation result
         """
-        if operation == "add":
-            result = a + b
-        elif operation == "subtract":
-            result = a - b
-        elif operation == "multiply":
-            result = a * b
-        elif operation == "divide":
-            if b == 0:
-                return {"error": "Division by zero"}
-            result = a / b
-        else:
+        op = _OPERATIONS.get(operation)
+        if op is None:
             return {"error": f"Unknown operation: {operation}"}
+        if operation == "divide" and b == 0:
+            return {"error": "Division by zero"}
+        result = op(a, b)
 
         return {
             "operation": operation,
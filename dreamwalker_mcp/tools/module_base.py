@@ -35,16 +35,331 @@ Example:
     # Use the tool
     tool = MyTool()
     result = tool.my_function(arg1="test")
+
+Subclass notes:
+    Modules with static schemas may define them once at class (or module)
+    level and hand out ``list(...)`` copies from initialize()/build_schemas().
+    Only the outer list is copied: the schema dicts themselves are shared by
+    every instance and by the registry, so they must never be mutated.
 """
 
-import argparse
+from __future__ import annotations
+
+import base64
+import concurrent.futures
+import errno
+import functools
+import importlib
 import logging
-import sys
-from typing import Any, Callable, Dict, List, Optional
+import math
+import mmap
+import os
+import threading
+import time
+from stat import S_ISDIR
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # argparse and sys are only needed by the CLI entry points, which import
+    # them on demand so library users don't pay for them.
+    import argparse
+
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+    # Match json.dumps' tolerance of int/float dict keys; encode numpy arrays natively
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+    _ORJSON_AVAILABLE = False
+    _ORJSON_OPTIONS = 0
 
 
 logger = logging.getLogger(__name__)
 
+_SWR_LOCK = threading.Lock()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    Uses orjson when installed, falling back to the standard library.
+    Either way NaN and infinities are encoded as null, as orjson does,
+    so the output is always valid JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if _ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. ints wider than 64 bits, which the stdlib encoder handles
+            pass
+    import json
+    try:
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode("utf-8")
+    except ValueError:
+        # Non-finite floats somewhere in obj; only then pay for a rebuild
+        return json.dumps(
+            _null_non_finite(obj), separators=(",", ":"), allow_nan=False
+        ).encode("utf-8")
+
+
+def _null_non_finite(obj: Any) -> Any:
+    """Return a copy of obj with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _null_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_null_non_finite(value) for value in obj]
+    return obj
+
+
+# Read-ahead hints applied to mapped image files where the platform has them
+_MADVISE_FLAGS = tuple(
+    flag
+    for flag in (getattr(mmap, "MADV_SEQUENTIAL", None), getattr(mmap, "MADV_WILLNEED", None))
+    if flag is not None
+)
+
+# Leading bytes → media type, as detected by the providers for raw bytes
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+_PATH_MAX = 4096  # longer strings can't be paths on common platforms
+
+# stat() errnos meaning "no such file", so the argument is taken as base64;
+# any other OSError (permissions, directories, I/O) is a real failure
+_NOT_A_PATH_ERRNOS = frozenset(
+    (errno.ENOENT, errno.ENOTDIR, errno.ENAMETOOLONG, errno.ELOOP, errno.EBADF)
+)
+
+
+def _sniff_media_type(header: bytes) -> str:
+    """Guess an image media type from its first bytes (default JPEG)."""
+    for signature, media_type in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return media_type
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def encode_image_file(path: str) -> Tuple[str, str]:
+    """
+    Base64-encode an image file directly from a read-only memory map.
+
+    Providers would otherwise receive raw bytes and encode them again; the
+    encoder here reads straight from the mapped page cache, so the file is
+    never copied into an intermediate bytes object. The mapping is hinted
+    for sequential read-ahead where the platform supports madvise.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        Tuple of (base64 text, sniffed media type)
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            # Zero-length files cannot be mapped
+            return "", "image/jpeg"
+        with mmap.mmap(fd, size, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                for flag in _MADVISE_FLAGS:
+                    mapped.madvise(flag)
+            return base64.b64encode(mapped).decode("ascii"), _sniff_media_type(mapped[:12])
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_image_payload(path: str, mtime_ns: int, size: int) -> Tuple[str, str]:
+    """Memoized encode_image_file; the stat fields make edits miss the cache."""
+    return encode_image_file(path)
+
+
+def load_image_payload(image: str) -> Tuple[str, Optional[str]]:
+    """
+    Resolve an image argument that is either a file path or base64 data.
+
+    Files are encoded once and cached by path, modification time and size,
+    so repeated questions about one image skip the file I/O and encoding.
+    Arguments that don't name a file (including data: URIs and strings too
+    long to be a path) are passed through as base64.
+
+    Args:
+        image: Path to an image file, or base64-encoded image data
+
+    Returns:
+        Tuple of (base64 text, media type); the media type is None when the
+        input was passed through unchanged
+
+    Raises:
+        OSError: If the path exists but can't be read (e.g. a directory or
+            a permission error)
+    """
+    if len(image) > _PATH_MAX or image.startswith("data:"):
+        return image, None
+    try:
+        info = os.stat(image)
+    except ValueError:
+        # Embedded NUL bytes; never a path
+        return image, None
+    except OSError as e:
+        if e.errno in _NOT_A_PATH_ERRNOS:
+            return image, None
+        raise
+    if S_ISDIR(info.st_mode):
+        raise IsADirectoryError(errno.EISDIR, os.strerror(errno.EISDIR), image)
+    return _cached_image_payload(image, info.st_mtime_ns, info.st_size)
+
+
+# Shared default for missing tool-call fields; never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+# Marks _TOOL_POOL worker threads so nested batches can run inline
+_POOL_THREAD = threading.local()
+
+
+def _mark_pool_thread():
+    """Flag the current thread as a _TOOL_POOL worker."""
+    _POOL_THREAD.active = True
+
+
+# Worker pool for running a batch of independent tool calls concurrently
+_TOOL_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8,
+    thread_name_prefix="tool",
+    initializer=_mark_pool_thread
+)
+# Overall deadline in seconds for one handle_tool_calls() batch; None waits
+# indefinitely. Calls still running at the deadline are reported as timed out
+# but are not cancelled: they keep running (and hold a pool worker) to the end.
+TOOL_CALL_TIMEOUT: Optional[float] = None
+
+_CONFIG_MGR = None
+
+
+def get_config_mgr():
+    """
+    Return the process-wide ConfigManager, creating it on first use.
+
+    ConfigManager loads environment and config files when constructed, so
+    tool modules share one instance rather than building their own.
+    """
+    global _CONFIG_MGR
+    if _CONFIG_MGR is None:
+        from config import ConfigManager
+        _CONFIG_MGR = ConfigManager()
+    return _CONFIG_MGR
+
+
+@functools.lru_cache(maxsize=None)
+def lazy_import(module_name: str, attr: str) -> Any:
+    """
+    Import ``module_name`` on first use and return one of its attributes.
+
+    Provider packages pull in heavy HTTP and model dependencies; tool modules
+    resolve them through this helper only when a tool is actually called, so
+    discovery doesn't pay for providers that are never used.
+
+    Args:
+        module_name: Absolute module path, e.g. 'llm_providers.factory'
+        attr: Attribute to fetch from the module
+
+    Returns:
+        The requested attribute
+    """
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _is_error_result(value: Any) -> bool:
+    """True for a tool result that reports a failure as {"error": ...}."""
+    return isinstance(value, dict) and "error" in value
+
+
+def swr_cache(ttl: float = 3600.0, stale_ttl: float = 86400.0) -> Callable:
+    """
+    Cache a no-argument tool method with stale-while-revalidate semantics.
+
+    Results younger than ``ttl`` seconds are returned as-is. Results older than
+    ``ttl`` but younger than ``stale_ttl`` are returned immediately while a
+    background thread refreshes them; a failed refresh keeps the stale value.
+    Anything older is recomputed inline.
+
+    A call that raises, or returns a dict with an ``"error"`` key (the tool
+    convention for reporting failures), is never cached.
+
+    Meant for slow-changing metadata such as model or voice listings. Cached
+    values are shared between callers and must not be mutated.
+
+    Args:
+        ttl: Seconds a cached result is considered fresh
+        stale_ttl: Seconds a cached result may be served while refreshing
+    """
+    def decorator(func: Callable) -> Callable:
+        key = func.__name__
+
+        def refresh(module: "ToolModuleBase") -> None:
+            entries = module._swr_entries
+            try:
+                value = func(module)
+                if _is_error_result(value):
+                    raise RuntimeError(value["error"])
+            except Exception as e:
+                logger.warning("Background refresh of '%s' failed: %s", key, e)
+                with _SWR_LOCK:
+                    value, stored_at, _ = entries[key]
+                    entries[key] = (value, stored_at, False)
+                return
+            with _SWR_LOCK:
+                entries[key] = (value, time.monotonic(), False)
+
+        @functools.wraps(func)
+        def wrapper(self):
+            entries = self._swr_entries
+            with _SWR_LOCK:
+                entry = entries.get(key)
+                if entry is not None:
+                    value, stored_at, refreshing = entry
+                    age = time.monotonic() - stored_at
+                    if age < ttl:
+                        return value
+                    if age < stale_ttl:
+                        if not refreshing:
+                            entries[key] = (value, stored_at, True)
+                            threading.Thread(
+                                target=refresh,
+                                args=(self,),
+                                name=f"swr-{key}",
+                                daemon=True
+                            ).start()
+                        return value
+
+            value = func(self)
+            if not _is_error_result(value):
+                with _SWR_LOCK:
+                    entries[key] = (value, time.monotonic(), False)
+            return value
+
+        return wrapper
+
+    return decorator
+
 
 class ToolModuleBase:
     """
@@ -63,6 +378,9 @@ class ToolModuleBase:
     - Registry integration
     - CLI interface
     - Configuration access
+
+    Tool handlers must be reentrant: when handle_tool_calls() receives
+    several calls at once they run concurrently on a shared thread pool.
     """
 
     # Module metadata - override in subclasses
@@ -71,6 +389,11 @@ class ToolModuleBase:
     description = "No description available"
     version = "1.0.0"
 
+    # CLI parser built once per class by run_cli(). Subclasses whose
+    # setup_cli_args() depends on instance state should reset this to None
+    # before calling run_cli().
+    _cached_parser: ClassVar[Optional[argparse.ArgumentParser]] = None
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the module.
@@ -81,6 +404,8 @@ class ToolModuleBase:
         self.config = config or {}
         self.tool_schemas = []
         self.tool_handlers = {}
+        self._swr_entries = {}
+        self._tool_schemas_json_bytes = None
 
         # Call custom initialization
         self.initialize()
@@ -169,12 +494,18 @@ class ToolModuleBase:
         """
         Build a map of tool names to handler methods.
 
-        Automatically maps schema function names to class methods.
+        Automatically maps schema function names to class methods. Handlers
+        are bound once here, so handle_tool_calls() dispatches with a single
+        dict lookup and no per-call attribute resolution.
         """
+        handlers = self.tool_handlers
         for schema in self.tool_schemas:
-            func_name = schema.get("function", {}).get("name")
-            if func_name and hasattr(self, func_name):
-                self.tool_handlers[func_name] = getattr(self, func_name)
+            func_name = (schema.get("function") or _EMPTY).get("name")
+            if not func_name:
+                continue
+            handler = getattr(self, func_name, None)
+            if handler is not None:
+                handlers[func_name] = handler
 
     def get(self, attr: str, default: Any = None) -> Any:
         """
@@ -198,6 +529,21 @@ class ToolModuleBase:
         """
         return self.tool_schemas.copy()
 
+    def get_tool_schemas_json(self) -> bytes:
+        """
+        Get tool schemas for this module as encoded JSON.
+
+        The payload is serialized on first use and cached, so repeated
+        tools/list responses skip re-encoding. Schemas must be final by the
+        time this is first called.
+
+        Returns:
+            JSON bytes of the OpenAI-compatible tool schema list
+        """
+        if self._tool_schemas_json_bytes is None:
+            self._tool_schemas_json_bytes = dumps_bytes(self.tool_schemas)
+        return self._tool_schemas_json_bytes
+
     def handle_tool_calls(
         self,
         tool_calls: List[Dict],
@@ -215,19 +561,42 @@ class ToolModuleBase:
         """
         config = config or self.config
         responses = []
+        responses_append = responses.append
+        handlers_get = self.tool_handlers.get
 
+        calls = []
         for tool_call in tool_calls:
             # Extract tool call info
             tool_id = tool_call.get("id", "unknown")
-            function_name = tool_call.get("function", {}).get("name", "unknown")
-            arguments = tool_call.get("function", {}).get("arguments", {})
-
-            # Find handler
-            handler = self.tool_handlers.get(function_name)
+            function = tool_call.get("function") or _EMPTY
+            function_name = function.get("name", "unknown")
+            arguments = function.get("arguments", _EMPTY)
+
+            calls.append((tool_id, function_name, handlers_get(function_name), arguments))
+
+        # Independent calls are usually I/O bound, so run batches concurrently;
+        # a lone call only goes through the pool when a deadline applies.
+        # A handler already running on a pool worker runs its own batch
+        # inline: waiting on the pool from inside it could deadlock once
+        # every worker is blocked on nested calls.
+        timeout = TOOL_CALL_TIMEOUT
+        done = ()
+        if (len(calls) > 1 or timeout is not None) and not getattr(_POOL_THREAD, "active", False):
+            futures = [
+                _TOOL_POOL.submit(self._invoke_handler, handler, arguments)
+                if handler is not None else None
+                for _, _, handler, arguments in calls
+            ]
+            pending = [future for future in futures if future is not None]
+            if pending:
+                done, _ = concurrent.futures.wait(pending, timeout=timeout)
+        else:
+            futures = [None] * len(calls)
 
+        for (tool_id, function_name, handler, arguments), future in zip(calls, futures):
             if handler is None:
                 # Unknown tool
-                responses.append({
+                responses_append({
                     "tool_call_id": tool_id,
                     "role": "tool",
                     "name": function_name,
@@ -235,23 +604,24 @@ class ToolModuleBase:
                 })
                 continue
 
+            if future is not None and future not in done:
+                # Past the batch deadline; the call itself keeps running
+                logger.error("Tool call %r timed out after %ss", function_name, timeout)
+                responses_append({
+                    "tool_call_id": tool_id,
+                    "role": "tool",
+                    "name": function_name,
+                    "content": f"Error: Tool call timed out after {timeout}s"
+                })
+                continue
+
             try:
-                # Call handler
-                if isinstance(arguments, dict):
-                    result = handler(**arguments)
-                else:
-                    result = handler(arguments)
-
-                # Format response
-                if isinstance(result, str):
-                    content = result
-                elif isinstance(result, dict):
-                    import json
-                    content = json.dumps(result)
+                if future is None:
+                    content = self._invoke_handler(handler, arguments)
                 else:
-                    content = str(result)
+                    content = future.result()
 
-                responses.append({
+                responses_append({
                     "tool_call_id": tool_id,
                     "role": "tool",
                     "name": function_name,
@@ -259,8 +629,8 @@ class ToolModuleBase:
                 })
 
             except Exception as e:
-                logger.error(f"Error handling tool call '{function_name}': {e}")
-                responses.append({
+                logger.error("Error handling tool call %r: %s", function_name, e)
+                responses_append({
                     "tool_call_id": tool_id,
                     "role": "tool",
                     "name": function_name,
@@ -269,6 +639,32 @@ class ToolModuleBase:
 
         return responses
 
+    @staticmethod
+    def _invoke_handler(handler: Callable, arguments: Any) -> str:
+        """
+        Call a tool handler and format its result as response content.
+
+        Args:
+            handler: Tool handler method
+            arguments: Keyword arguments dict, or a single positional argument
+
+        Returns:
+            Result as a string (dicts are JSON-encoded)
+        """
+        # Call handler
+        if isinstance(arguments, dict):
+            result = handler(**arguments)
+        else:
+            result = handler(arguments)
+
+        # Format response (exact type checks first, they are cheaper)
+        result_type = type(result)
+        if result_type is str:
+            return result
+        if result_type is dict or isinstance(result, dict):
+            return dumps_bytes(result).decode("utf-8")
+        return str(result)
+
     def register_with_registry(self, registry=None) -> Dict[str, Any]:
         """
         Register this module with a registry.
@@ -313,7 +709,7 @@ class ToolModuleBase:
             return {"success": True, "module": self.name}
 
         except Exception as e:
-            logger.error(f"Error registering module '{self.name}': {e}")
+            logger.error("Error registering module %r: %s", self.name, e)
             return {"success": False, "error": str(e)}
 
     def setup_cli_args(self, parser: argparse.ArgumentParser):
@@ -354,16 +750,26 @@ class ToolModuleBase:
             "message": "Interactive mode not implemented for this module"
         }
 
-    def run_cli(self, args=None) -> Dict[str, Any]:
+    def _get_cli_parser(self) -> argparse.ArgumentParser:
         """
-        Run the CLI interface for this module.
+        Get the CLI argument parser for this module's class.
 
-        Args:
-            args: Command-line arguments (defaults to sys.argv[1:])
+        The parser (including arguments added by setup_cli_args) is built on
+        first use and cached on the class, so repeated run_cli() calls skip
+        the argparse setup.
 
         Returns:
-            Result of CLI execution
+            Configured ArgumentParser
         """
+        cls = type(self)
+        # Look in the class's own namespace so subclasses never reuse a
+        # parser cached for a parent class.
+        parser = cls.__dict__.get("_cached_parser")
+        if parser is not None:
+            return parser
+
+        import argparse
+
         # Create argument parser
         parser = argparse.ArgumentParser(
             description=f"{self.display_name}: {self.description}"
@@ -399,6 +805,21 @@ class ToolModuleBase:
         # Custom argument setup
         self.setup_cli_args(parser)
 
+        cls._cached_parser = parser
+        return parser
+
+    def run_cli(self, args=None) -> Dict[str, Any]:
+        """
+        Run the CLI interface for this module.
+
+        Args:
+            args: Command-line arguments (defaults to sys.argv[1:])
+
+        Returns:
+            Result of CLI execution
+        """
+        parser = self._get_cli_parser()
+
         # Parse arguments
         parsed_args = parser.parse_args(args)
 
@@ -462,13 +883,26 @@ class ToolModuleBase:
             if __name__ == '__main__':
                 MyTool.main()
         """
+        import sys
+
         module = cls()
         result = module.run_cli()
 
         # Print result unless it's already been handled
         if isinstance(result, dict) and result.get("status") != "handled":
-            import json
-            print(json.dumps(result, indent=2))
+            if sys.stdout.isatty():
+                import json
+                print(json.dumps(result, indent=2))
+            else:
+                # Piped output: compact JSON written straight to the buffer,
+                # unless stdout is a text-only stream (e.g. redirect_stdout)
+                buf = getattr(sys.stdout, "buffer", None)
+                if buf is not None:
+                    sys.stdout.flush()
+                    buf.write(dumps_bytes(result) + b"\n")
+                    buf.flush()
+                else:
+                    sys.stdout.write(dumps_bytes(result).decode("utf-8") + "\n")
 
         # Return appropriate exit code
         if isinstance(result, dict) and result.get("status") == "error":
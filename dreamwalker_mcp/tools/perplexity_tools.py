@@ -10,7 +10,7 @@ Author: Luke Steuber
 
 from typing import Dict, Any, List
 
-from .module_base import ToolModuleBase
+from .module_base import ToolModuleBase, swr_cache
 
 
 class PerplexityTools(ToolModuleBase):
@@ -85,6 +85,7 @@ class PerplexityTools(ToolModuleBase):
         result["metadata"]["has_citations"] = True
         return result
 
+    @swr_cache(ttl=3600, stale_ttl=86400)
     def perplexity_list_models(self) -> Dict[str, Any]:
         """List Perplexity models."""
         models = self.provider.list_models()
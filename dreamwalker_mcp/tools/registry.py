@@ -7,21 +7,27 @@ Extracted and generalized from swarm/core/core_registry.py.
 Key Features:
 - Singleton pattern for global registry access
 - Tool schema registration with deduplication
+- Interning of repeated schema subtrees across tools
 - Module configuration and enable/disable
 - Handler registration and lookup
 - Discovery status tracking
 """
 
-import copy
+import hashlib
 import importlib
-import inspect
+import importlib.util
+import json
 import logging
 import pkgutil
-from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
 
 class ToolRegistry:
     """
@@ -52,8 +58,29 @@ class ToolRegistry:
         tools = registry.get_enabled_tools()
     """
 
+    __slots__ = (
+        "tools",
+        "_schema_by_name",
+        "_intern_pool",
+        "tool_modules",
+        "_module_config",
+        "_modules",
+        "_module_ids",
+        "_module_enabled",
+        "_tool_module_ids",
+        "_discovery_complete",
+        "_registered_handlers",
+        "_generation",
+        "_enabled_tools_cache",
+        "_enabled_schemas_cache",
+        "_metrics",
+    )
+
     _instance = None
 
+    # Package scans only import submodules whose names end with one of these
+    TOOL_MODULE_SUFFIXES = ("_tool", "_tools")
+
     @classmethod
     def get_instance(cls):
         """Get the singleton registry instance."""
@@ -70,21 +97,36 @@ class ToolRegistry:
         """Initialize an empty registry."""
         # Tool storage
         self.tools = {}  # name → {schema, handler, module}
-        self.tool_schemas = []  # List of all schemas
-        self.tool_modules = {}  # module_name → [tool_names]
+        self._schema_by_name = {}  # function name → schema, in registration order
+        self._intern_pool = {}  # digest → canonical schema subtree
+        self.tool_modules = {}  # module_name → {tool_name: None} (ordered set)
 
         # Module storage
         self._module_config = {}  # module_name → config dict
         self._modules = {}  # module_name → module object
+        self._module_ids = {}  # module_name → compact int id
+        self._module_enabled = bytearray()  # module id → 1 if enabled, else 0
+        self._tool_module_ids = {}  # tool name → id of its module
 
         # Discovery state
         self._discovery_complete = False
+        self._registered_handlers = set()  # (module_name, tool_name) seen by discovery
+
+        # Derived-view caches, valid while their generation matches
+        self._generation = 0  # bumped on every mutation
+        self._enabled_tools_cache = None  # (generation, enabled tools dict)
+        self._enabled_schemas_cache = None  # (generation, enabled schemas list)
 
         # Metrics
         self._reset_metrics()
 
         logger.info("ToolRegistry initialized")
 
+    @property
+    def tool_schemas(self) -> List[Dict]:
+        """List of all registered schemas, built on demand."""
+        return list(self._schema_by_name.values())
+
     def register_tool(
         self,
         name: str,
@@ -108,7 +150,7 @@ class ToolRegistry:
         """
         # Check if already registered
         if name in self.tools:
-            logger.debug(f"Tool '{name}' already registered, skipping")
+            logger.debug("Tool '%s' already registered, skipping", name)
             self._metrics["duplicate_tools"] += 1
             return False
 
@@ -120,31 +162,100 @@ class ToolRegistry:
             logger.error("Tool schema validation failed for %s: %s", name, exc)
             raise
 
+        self._store_tool(name, schema, handler, module_name, kwargs)
+
+        self._generation += 1
+        self._metrics["registered_tools"] += 1
+        logger.info("Registered tool '%s' from module '%s'", name, module_name)
+        return True
+
+    def register_tools(
+        self,
+        specs: Iterable[Tuple[str, Dict, Callable, str, Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """
+        Register many tools in a single pass.
+
+        Unlike register_tool(), invalid schemas do not raise; they are
+        recorded and skipped so the rest of the batch still registers.
+        Derived caches are invalidated once for the whole batch.
+
+        Args:
+            specs: Iterable of (name, schema, handler, module_name, metadata)
+                tuples; metadata may be None
+
+        Returns:
+            Dict with 'registered' tool names and 'errors' mapping tool
+            name to validation error
+        """
+        tools = self.tools
+        registered: List[str] = []
+        errors: Dict[str, str] = {}
+        valid: List[Tuple[str, Dict, Callable, str, Optional[Dict[str, Any]]]] = []
+        seen = set()
+
+        # Validate everything before touching registry state
+        for spec in specs:
+            name, schema = spec[0], spec[1]
+            if name in tools or name in seen:
+                logger.debug("Tool '%s' already registered, skipping", name)
+                self._metrics["duplicate_tools"] += 1
+                continue
+            try:
+                self._validate_schema(schema)
+            except ValueError as exc:
+                errors[name] = str(exc)
+                self._metrics["validation_failures"].append({"tool": name, "error": str(exc)})
+                logger.error("Tool schema validation failed for %s: %s", name, exc)
+                continue
+            seen.add(name)
+            valid.append(spec)
+
+        for name, schema, handler, module_name, metadata in valid:
+            self._store_tool(name, schema, handler, module_name, metadata or _EMPTY_METADATA)
+            registered.append(name)
+
+        if registered:
+            self._generation += 1
+            self._metrics["registered_tools"] += len(registered)
+            logger.info("Registered %d tools in batch", len(registered))
+
+        return {"registered": registered, "errors": errors}
+
+    def _store_tool(
+        self,
+        name: str,
+        schema: Dict,
+        handler: Callable,
+        module_name: str,
+        metadata: Mapping[str, Any]
+    ) -> None:
+        """Insert an already validated tool into the registry indexes."""
+        # Share parameter subtrees that are identical across tools
+        function_block = schema["function"]
+        schema = {
+            **schema,
+            "function": {
+                **function_block,
+                "parameters": self._intern(function_block["parameters"]),
+            },
+        }
+
         # Register tool
         self.tools[name] = {
             "schema": schema,
             "handler": handler,
             "module": module_name,
-            **kwargs
+            **metadata
         }
+        self._tool_module_ids[name] = self._module_id(module_name)
 
         # Add schema if not already present
-        schema_name = schema.get("function", {}).get("name", name)
-        if not any(
-            s.get("function", {}).get("name") == schema_name
-            for s in self.tool_schemas
-        ):
-            self.tool_schemas.append(schema)
+        schema_name = schema["function"]["name"]
+        self._schema_by_name.setdefault(schema_name, schema)
 
         # Track module → tools mapping
-        if module_name not in self.tool_modules:
-            self.tool_modules[module_name] = []
-        if name not in self.tool_modules[module_name]:
-            self.tool_modules[module_name].append(name)
-
-        self._metrics["registered_tools"] += 1
-        logger.info(f"Registered tool '{name}' from module '{module_name}'")
-        return True
+        self.tool_modules.setdefault(module_name, {})[name] = None
 
     def unregister_tool(self, name: str) -> bool:
         """
@@ -160,21 +271,21 @@ class ToolRegistry:
             return False
 
         tool_info = self.tools.pop(name)
+        self._tool_module_ids.pop(name, None)
         module_name = tool_info.get("module", "unknown")
+        self._registered_handlers.discard((module_name, name))
 
         # Remove from module mapping
-        if module_name in self.tool_modules:
-            if name in self.tool_modules[module_name]:
-                self.tool_modules[module_name].remove(name)
+        module_tools = self.tool_modules.get(module_name)
+        if module_tools is not None:
+            module_tools.pop(name, None)
 
         # Remove schema
         schema_name = tool_info["schema"].get("function", {}).get("name", name)
-        self.tool_schemas = [
-            s for s in self.tool_schemas
-            if s.get("function", {}).get("name") != schema_name
-        ]
+        self._schema_by_name.pop(schema_name, None)
 
-        logger.info(f"Unregistered tool '{name}'")
+        self._generation += 1
+        logger.info("Unregistered tool '%s'", name)
         return True
 
     def register_module(
@@ -195,7 +306,7 @@ class ToolRegistry:
             True if registered, False if already existed
         """
         if name in self._modules:
-            logger.debug(f"Module '{name}' already registered, skipping")
+            logger.debug("Module '%s' already registered, skipping", name)
             return False
 
         self._modules[name] = module
@@ -208,8 +319,10 @@ class ToolRegistry:
                 "dependencies": []
             }
 
-        self._module_config[name] = config
-        logger.info(f"Registered module '{name}'")
+        self._module_config[name] = dict(config)
+        self._sync_module_enabled(name)
+        self._generation += 1
+        logger.info("Registered module '%s'", name)
         return True
 
     def enable_module(self, module_name: str, enabled: bool = True):
@@ -229,7 +342,9 @@ class ToolRegistry:
         else:
             self._module_config[module_name]["enabled"] = enabled
 
-        logger.info(f"{'Enabled' if enabled else 'Disabled'} module '{module_name}'")
+        self._sync_module_enabled(module_name)
+        self._generation += 1
+        logger.info("%s module '%s'", "Enabled" if enabled else "Disabled", module_name)
 
     def is_module_enabled(self, module_name: str) -> bool:
         """
@@ -241,21 +356,56 @@ class ToolRegistry:
         Returns:
             True if enabled, False otherwise
         """
-        return self._module_config.get(module_name, {}).get("enabled", True)
+        # Modules with an id have their flag kept current in _module_enabled
+        module_id = self._module_ids.get(module_name)
+        if module_id is not None:
+            return bool(self._module_enabled[module_id])
+        return self._config_enabled(module_name)
+
+    def _module_id(self, module_name: str) -> int:
+        """
+        Get the compact id for a module, assigning one on first use.
+
+        _tool_module_ids maps each tool to this id so filters can test
+        enablement by indexing _module_enabled instead of looking up
+        module config.
+        """
+        module_id = self._module_ids.get(module_name)
+        if module_id is None:
+            module_id = len(self._module_enabled)
+            self._module_enabled.append(1 if self._config_enabled(module_name) else 0)
+            self._module_ids[module_name] = module_id
+        return module_id
+
+    def _sync_module_enabled(self, module_name: str):
+        """Refresh a module's enabled flag after its config changes."""
+        module_id = self._module_id(module_name)
+        # Config values may be any truthy/falsy object, not just bools
+        self._module_enabled[module_id] = 1 if self._config_enabled(module_name) else 0
+
+    def _config_enabled(self, module_name: str) -> bool:
+        """Read a module's enabled flag from its config (default True)."""
+        config = self._module_config.get(module_name)
+        return True if config is None else bool(config.get("enabled", True))
 
-    def get_module_config(self, module_name: Optional[str] = None) -> Dict:
+    def get_module_config(self, module_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Get module configuration.
 
+        Configs are stored and returned as copies, so the enabled flags
+        cached in _module_enabled only change through enable_module(),
+        register_module() and set_module_config().
+
         Args:
             module_name: Specific module name, or None for all configs
 
         Returns:
-            Module config dict or all configs
+            Copy of one module's config dict, or a dict of copies of all
+            configs
         """
         if module_name is None:
-            return self._module_config.copy()
-        return self._module_config.get(module_name, {}).copy()
+            return {name: dict(config) for name, config in self._module_config.items()}
+        return dict(self._module_config.get(module_name, {}))
 
     def set_module_config(self, module_name: str, config: Dict[str, Any]):
         """
@@ -265,8 +415,10 @@ class ToolRegistry:
             module_name: Name of module
             config: Configuration dictionary
         """
-        self._module_config[module_name] = config
-        logger.debug(f"Updated config for module '{module_name}'")
+        self._module_config[module_name] = dict(config)
+        self._sync_module_enabled(module_name)
+        self._generation += 1
+        logger.debug("Updated config for module '%s'", module_name)
 
     def get_tool(self, name: str) -> Optional[Dict]:
         """
@@ -293,27 +445,39 @@ class ToolRegistry:
         tool = self.tools.get(name)
         return tool["handler"] if tool else None
 
-    def get_all_tools(self) -> Dict[str, Dict]:
+    def get_all_tools(self) -> Mapping[str, Dict]:
         """
         Get all registered tools.
 
         Returns:
-            Dictionary of tool_name → tool_info
+            Read-only view of tool_name → tool_info (use dict(...) for a
+            mutable copy)
         """
-        return self.tools.copy()
+        return MappingProxyType(self.tools)
 
     def get_enabled_tools(self) -> Dict[str, Dict]:
         """
         Get all tools from enabled modules.
 
+        The result is cached until the registry changes and is shared
+        between callers, so it must not be mutated.
+
         Returns:
             Dictionary of tool_name → tool_info (only from enabled modules)
         """
-        enabled_tools = {}
-        for name, tool_info in self.tools.items():
-            module_name = tool_info.get("module", "unknown")
-            if self.is_module_enabled(module_name):
-                enabled_tools[name] = tool_info
+        cache = self._enabled_tools_cache
+        if cache is not None and cache[0] == self._generation:
+            return cache[1]
+
+        module_enabled = self._module_enabled
+        tool_module_ids = self._tool_module_ids
+        enabled_tools = {
+            name: tool_info
+            for name, tool_info in self.tools.items()
+            if module_enabled[tool_module_ids[name]]
+        }
+
+        self._enabled_tools_cache = (self._generation, enabled_tools)
         return enabled_tools
 
     def get_tool_schemas(self, enabled_only: bool = True) -> List[Dict]:
@@ -324,23 +488,30 @@ class ToolRegistry:
             enabled_only: If True, only return schemas from enabled modules
 
         Returns:
-            List of tool schemas
+            List of tool schemas. The enabled-only list is cached until the
+            registry changes and is shared between callers, so it must not
+            be mutated.
         """
         if not enabled_only:
-            return self.tool_schemas.copy()
+            return list(self._schema_by_name.values())
+
+        cache = self._enabled_schemas_cache
+        if cache is not None and cache[0] == self._generation:
+            return cache[1]
 
         # Filter to enabled modules
+        module_enabled = self._module_enabled
+        get_module_id = self._tool_module_ids.get
         enabled_schemas = []
-        for schema in self.tool_schemas:
-            schema_name = schema.get("function", {}).get("name")
-            if schema_name in self.tools:
-                module_name = self.tools[schema_name].get("module", "unknown")
-                if self.is_module_enabled(module_name):
-                    enabled_schemas.append(schema)
+        for schema_name, schema in self._schema_by_name.items():
+            module_id = get_module_id(schema_name)
+            if module_id is not None and module_enabled[module_id]:
+                enabled_schemas.append(schema)
 
+        self._enabled_schemas_cache = (self._generation, enabled_schemas)
         return enabled_schemas
 
-    def get_tools_by_module(self, module_name: str) -> List[str]:
+    def get_tools_by_module(self, module_name: str) -> Tuple[str, ...]:
         """
         Get all tool names for a specific module.
 
@@ -348,9 +519,9 @@ class ToolRegistry:
             module_name: Name of module
 
         Returns:
-            List of tool names
+            Tuple of tool names
         """
-        return self.tool_modules.get(module_name, []).copy()
+        return tuple(self.tool_modules.get(module_name, ()))
 
     def get_module_list(self, enabled_only: bool = False) -> List[str]:
         """
@@ -382,7 +553,8 @@ class ToolRegistry:
         Discover tool modules and optionally auto-register them.
 
         Args:
-            package: Package path to scan (default 'shared.tools')
+            package: Package path to scan (default 'shared.tools'); only direct
+                submodules matching TOOL_MODULE_SUFFIXES are imported
             auto_register: Instantiate ToolModuleBase subclasses and register tools
             module_names: Explicit list of modules to scan (skips package walking)
             skip_errors: Continue discovery after encountering errors
@@ -393,31 +565,45 @@ class ToolRegistry:
         discovered: List[str] = []
         errors: Dict[str, str] = {}
 
-        modules_to_scan: List[str] = list(module_names or [])
+        modules_to_scan: Iterable[str] = list(module_names or [])
         if not modules_to_scan:
             try:
                 pkg = importlib.import_module(package)
-                if getattr(pkg, "__path__", None):
-                    prefix = pkg.__name__ + "."
-                    for _, name, _ in pkgutil.walk_packages(pkg.__path__, prefix):
-                        modules_to_scan.append(name)
             except Exception as exc:
                 error_msg = f"Unable to import package '{package}': {exc}"
                 logger.error(error_msg)
                 return {"modules": [], "errors": {package: error_msg}}
+            # Names are produced lazily; each module is imported as it comes up
+            modules_to_scan = self._iter_tool_module_names(pkg)
 
         ToolModuleBase = self._lazy_import_tool_base()
 
+        loaded_modules = sys.modules
+
+        # Tools are collected across all modules and registered as one batch
+        pending: List[Tuple[str, Dict, Callable, str, Dict[str, Any]]] = []
+        pending_origin: Dict[str, Tuple[str, Tuple[str, str]]] = {}
+
         for module_name in modules_to_scan:
-            try:
-                module = importlib.import_module(module_name)
-                discovered.append(module_name)
-            except Exception as exc:
-                errors[module_name] = str(exc)
-                logger.debug("Failed to import tool module %s: %s", module_name, exc)
-                if not skip_errors:
-                    raise
-                continue
+            module = loaded_modules.get(module_name)
+            if module is None:
+                try:
+                    # Cheap existence check before paying for a full import
+                    if importlib.util.find_spec(module_name) is None:
+                        errors[module_name] = f"No module named '{module_name}'"
+                        logger.debug("Tool module %s not found", module_name)
+                        if not skip_errors:
+                            raise ModuleNotFoundError(errors[module_name], name=module_name)
+                        continue
+                    module = importlib.import_module(module_name)
+                except Exception as exc:
+                    errors[module_name] = str(exc)
+                    logger.debug("Failed to import tool module %s: %s", module_name, exc)
+                    if not skip_errors:
+                        raise
+                    continue
+
+            discovered.append(module_name)
 
             if not auto_register:
                 continue
@@ -425,8 +611,9 @@ class ToolRegistry:
             try:
                 tool_classes = [
                     member
-                    for _, member in inspect.getmembers(module, inspect.isclass)
-                    if issubclass(member, ToolModuleBase)
+                    for member in vars(module).values()
+                    if isinstance(member, type)
+                    and issubclass(member, ToolModuleBase)
                     and member is not ToolModuleBase
                     and getattr(member, "auto_register", True)
                 ]
@@ -448,10 +635,22 @@ class ToolRegistry:
 
                 self.register_module(tool_cls.name, instance)
 
+                # Handlers were already bound when the module built its
+                # handler map; only fall back to attribute lookup on a miss.
+                handlers = getattr(instance, "tool_handlers", None) or {}
+
                 for schema in instance.get_tool_schemas():
                     function_def = schema.get("function", {})
                     handler_name = function_def.get("name")
-                    handler = getattr(instance, handler_name, None)
+
+                    # Already registered by an earlier discovery pass
+                    registered_key = (tool_cls.name, handler_name)
+                    if registered_key in self._registered_handlers:
+                        continue
+
+                    handler = handlers.get(handler_name)
+                    if handler is None:
+                        handler = getattr(instance, handler_name, None)
 
                     if not callable(handler):
                         error_msg = f"Handler '{handler_name}' not found on {tool_cls.__name__}"
@@ -460,26 +659,55 @@ class ToolRegistry:
                             raise ValueError(error_msg)
                         continue
 
-                    try:
-                        self.register_tool(
-                            name=function_def.get("name", tool_cls.name),
-                            schema=schema,
-                            handler=handler,
-                            module_name=tool_cls.name,
-                            module_class=tool_cls.__name__,
+                    tool_name = function_def.get("name", tool_cls.name)
+                    pending.append(
+                        (
+                            tool_name,
+                            schema,
+                            handler,
+                            tool_cls.name,
+                            {"module_class": tool_cls.__name__},
                         )
-                    except Exception as exc:
-                        errors[module_name] = str(exc)
-                        if not skip_errors:
-                            raise
+                    )
+                    pending_origin.setdefault(tool_name, (module_name, registered_key))
+
+        if pending:
+            result = self.register_tools(pending)
+            for tool_name in result["registered"]:
+                self._registered_handlers.add(pending_origin[tool_name][1])
+            for tool_name, error_msg in result["errors"].items():
+                errors[pending_origin[tool_name][0]] = error_msg
+            if result["errors"] and not skip_errors:
+                raise ValueError(next(iter(result["errors"].values())))
 
         self._metrics["discovery"]["modules"] = discovered
         self._metrics["discovery"]["errors"] = errors
         return {"modules": discovered, "errors": errors}
 
+    @classmethod
+    def _iter_tool_module_names(cls, pkg: Any) -> Iterator[str]:
+        """Yield the package's direct submodules that follow the tool naming convention."""
+        path = getattr(pkg, "__path__", None)
+        if not path:
+            return
+        suffixes = cls.TOOL_MODULE_SUFFIXES
+        for _, name, _ in pkgutil.iter_modules(path, pkg.__name__ + "."):
+            if name.endswith(suffixes):
+                yield name
+
     def get_metrics(self) -> Dict[str, Any]:
         """Return a snapshot of registry metrics."""
-        return copy.deepcopy(self._metrics)
+        metrics = self._metrics
+        discovery = metrics["discovery"]
+        return {
+            "registered_tools": metrics["registered_tools"],
+            "duplicate_tools": metrics["duplicate_tools"],
+            "validation_failures": [dict(failure) for failure in metrics["validation_failures"]],
+            "discovery": {
+                "modules": list(discovery["modules"]),
+                "errors": dict(discovery["errors"]),
+            },
+        }
 
     def _reset_metrics(self):
         self._metrics = {
@@ -490,6 +718,26 @@ class ToolRegistry:
         }
 
     def _validate_schema(self, schema: Dict[str, Any]) -> None:
+        # Fast path: a well-formed schema passes with direct indexing and no
+        # intermediate defaults.
+        try:
+            function_block = schema["function"]
+            parameters = function_block["parameters"]
+            if (
+                isinstance(schema, dict)
+                and schema["type"] == "function"
+                and isinstance(function_block, dict)
+                and function_block["name"]
+                and function_block["description"]
+                and isinstance(parameters, dict)
+                and parameters["type"] == "object"
+                and isinstance(parameters["properties"], dict)
+            ):
+                return
+        except (KeyError, TypeError):
+            pass
+
+        # Slow path: find the first problem and report it precisely
         if not isinstance(schema, dict):
             raise ValueError("Tool schema must be a dictionary")
 
@@ -516,6 +764,34 @@ class ToolRegistry:
         if "properties" not in parameters or not isinstance(parameters["properties"], dict):
             raise ValueError("Tool schema parameters must include a 'properties' dictionary")
 
+    def _intern(self, obj: Any) -> Any:
+        """
+        Return the canonical shared instance of a JSON-schema subtree.
+
+        Structurally identical dicts and lists registered by different tools
+        resolve to one object, so repeated parameter definitions are stored
+        once. Interned objects are shared and must not be mutated.
+
+        Args:
+            obj: Schema fragment (dicts and lists are interned recursively)
+
+        Returns:
+            Canonical instance equal to obj
+        """
+        if isinstance(obj, dict):
+            obj = {key: self._intern(value) for key, value in obj.items()}
+        elif isinstance(obj, list):
+            obj = [self._intern(value) for value in obj]
+        else:
+            return obj
+
+        try:
+            encoded = json.dumps(obj, sort_keys=True).encode("utf-8")
+        except (TypeError, ValueError):
+            return obj
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        return self._intern_pool.setdefault(digest, obj)
+
     @staticmethod
     def _lazy_import_tool_base():
         from .module_base import ToolModuleBase
@@ -525,11 +801,17 @@ class ToolRegistry:
     def clear(self):
         """Clear all registered tools and modules."""
         self.tools.clear()
-        self.tool_schemas.clear()
+        self._schema_by_name.clear()
+        self._intern_pool.clear()
         self.tool_modules.clear()
         self._module_config.clear()
         self._modules.clear()
+        self._module_ids.clear()
+        self._module_enabled = bytearray()
+        self._tool_module_ids.clear()
         self._discovery_complete = False
+        self._registered_handlers.clear()
+        self._generation += 1
         self._reset_metrics()
         logger.info("Registry cleared")
 
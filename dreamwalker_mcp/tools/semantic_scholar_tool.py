@@ -9,6 +9,27 @@ from typing import Any, Dict, List
 from .data_tool_base import DataToolModuleBase
 
 
+# Parameter shared by the search schemas
+_LIMIT_PARAM: Dict[str, Any] = {
+    "type": "integer",
+    "default": 10,
+    "description": "Maximum number of results (<=25).",
+}
+
+
+def _object_params(properties: Dict[str, Any], required: List[str]) -> Dict[str, Any]:
+    """Build an object-typed parameters block."""
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _function_schema(name: str, description: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an OpenAI-style function tool schema."""
+    return {
+        "type": "function",
+        "function": {"name": name, "description": description, "parameters": parameters},
+    }
+
+
 class SemanticScholarTools(DataToolModuleBase):
     """Expose Semantic Scholar search and retrieval operations as tools."""
 
@@ -20,70 +41,46 @@ class SemanticScholarTools(DataToolModuleBase):
     api_key_name = None
     max_records = 25
 
-    def build_schemas(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "semantic_scholar_search",
-                    "description": "Search Semantic Scholar for papers.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query string."},
-                            "limit": {
-                                "type": "integer",
-                                "default": 10,
-                                "description": "Maximum number of results (<=25).",
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "semantic_scholar_get_paper",
-                    "description": "Retrieve a paper by DOI.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "doi": {"type": "string", "description": "Digital Object Identifier."}
-                        },
-                        "required": ["doi"],
-                    },
+    _SCHEMAS: List[Dict[str, Any]] = [
+        _function_schema(
+            "semantic_scholar_search",
+            "Search Semantic Scholar for papers.",
+            _object_params(
+                {
+                    "query": {"type": "string", "description": "Search query string."},
+                    "limit": _LIMIT_PARAM,
                 },
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "semantic_scholar_search_author",
-                    "description": "Search Semantic Scholar for papers by an author.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "author": {"type": "string", "description": "Author name."},
-                            "limit": {
-                                "type": "integer",
-                                "default": 10,
-                                "description": "Maximum number of results (<=25).",
-                            },
-                        },
-                        "required": ["author"],
-                    },
+                ["query"],
+            ),
+        ),
+        _function_schema(
+            "semantic_scholar_get_paper",
+            "Retrieve a paper by DOI.",
+            _object_params(
+                {"doi": {"type": "string", "description": "Digital Object Identifier."}},
+                ["doi"],
+            ),
+        ),
+        _function_schema(
+            "semantic_scholar_search_author",
+            "Search Semantic Scholar for papers by an author.",
+            _object_params(
+                {
+                    "author": {"type": "string", "description": "Author name."},
+                    "limit": _LIMIT_PARAM,
                 },
-            },
-        ]
+                ["author"],
+            ),
+        ),
+    ]
+
+    def build_schemas(self) -> List[Dict[str, Any]]:
+        return list(self._SCHEMAS)
 
     @staticmethod
     def _papers_to_dict(papers: List[Any]) -> List[Dict[str, Any]]:
         """Convert SemanticScholarPaper objects to dictionaries."""
-        serialised: List[Dict[str, Any]] = []
-        for paper in papers:
-            if hasattr(paper, "to_dict"):
-                serialised.append(paper.to_dict())
-        return serialised
+        return [paper.to_dict() for paper in papers if hasattr(paper, "to_dict")]
 
     def semantic_scholar_search(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """Search Semantic Scholar for papers."""
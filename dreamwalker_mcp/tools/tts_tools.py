@@ -13,6 +13,61 @@ import os
 
 from .module_base import ToolModuleBase
 
+try:
+    from utils.tts import generate_tts_gtts
+except ImportError:  # pragma: no cover - optional dependency
+    generate_tts_gtts = None
+
+try:
+    from llm_providers.elevenlabs_provider import ElevenLabsProvider
+except ImportError:  # pragma: no cover - optional dependency
+    ElevenLabsProvider = None
+
+
+# Read once at import; initialize() re-checks the environment only when unset
+_ELEVENLABS_KEY = os.getenv('ELEVENLABS_API_KEY')
+
+_TTS_SCHEMAS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "text_to_speech",
+            "description": "Convert text to speech audio",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "text": {
+                        "type": "string",
+                        "description": "Text to convert to speech"
+                    },
+                    "provider": {
+                        "type": "string",
+                        "description": "TTS provider",
+                        "enum": ["gtts", "elevenlabs", "auto"],
+                        "default": "auto"
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": "Language code (for gTTS)",
+                        "default": "en"
+                    },
+                    "voice_id": {
+                        "type": "string",
+                        "description": "Voice ID (for ElevenLabs)",
+                        "default": "21m00Tcm4TlvDq8ikWAM"
+                    },
+                    "output_path": {
+                        "type": "string",
+                        "description": "Where to save audio file",
+                        "default": "/tmp/tts_output.mp3"
+                    }
+                },
+                "required": ["text"]
+            }
+        }
+    }
+]
+
 
 class TTSTools(ToolModuleBase):
     """Text-to-speech tools."""
@@ -24,48 +79,9 @@ class TTSTools(ToolModuleBase):
 
     def initialize(self):
         """Initialize TTS tool schemas."""
-        self.elevenlabs_key = os.getenv('ELEVENLABS_API_KEY')
+        self.elevenlabs_key = _ELEVENLABS_KEY or os.environ.get('ELEVENLABS_API_KEY')
         
-        self.tool_schemas = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "text_to_speech",
-                    "description": "Convert text to speech audio",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "text": {
-                                "type": "string",
-                                "description": "Text to convert to speech"
-                            },
-                            "provider": {
-                                "type": "string",
-                                "description": "TTS provider",
-                                "enum": ["gtts", "elevenlabs", "auto"],
-                                "default": "auto"
-                            },
-                            "language": {
-                                "type": "string",
-                                "description": "Language code (for gTTS)",
-                                "default": "en"
-                            },
-                            "voice_id": {
-                                "type": "string",
-                                "description": "Voice ID (for ElevenLabs)",
-                                "default": "21m00Tcm4TlvDq8ikWAM"
-                            },
-                            "output_path": {
-                                "type": "string",
-                                "description": "Where to save audio file",
-                                "default": "/tmp/tts_output.mp3"
-                            }
-                        },
-                        "required": ["text"]
-                    }
-                }
-            }
-        ]
+        self.tool_schemas = list(_TTS_SCHEMAS)
 
     def text_to_speech(self, text: str, provider: str = "auto", language: str = "en",
                       voice_id: str = "21m00Tcm4TlvDq8ikWAM", 
@@ -89,7 +105,8 @@ class TTSTools(ToolModuleBase):
         
         try:
             if provider == "gtts":
-                from utils.tts import generate_tts_gtts
+                if generate_tts_gtts is None:
+                    return {"error": "gTTS support not available (utils.tts not importable)"}
                 audio_path = generate_tts_gtts(text, language=language, output_path=output_path)
                 return {
                     "audio_path": audio_path,
@@ -101,8 +118,9 @@ class TTSTools(ToolModuleBase):
             elif provider == "elevenlabs":
                 if not self.elevenlabs_key:
                     return {"error": "ELEVENLABS_API_KEY not configured"}
+                if ElevenLabsProvider is None:
+                    return {"error": "ElevenLabs provider not available"}
                 
-                from llm_providers.elevenlabs_provider import ElevenLabsProvider
                 provider_instance = ElevenLabsProvider(api_key=self.elevenlabs_key)
                 
                 # This requires implementation in elevenlabs_provider
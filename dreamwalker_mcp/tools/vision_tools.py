@@ -6,10 +6,18 @@ Multi-provider vision analysis tool using the best available provider.
 Author: Luke Steuber
 """
 
-from typing import Dict, Any, Optional
-from pathlib import Path
+import concurrent.futures
+import time
+from typing import Dict, Any, List, Optional
 
-from .module_base import ToolModuleBase
+from .module_base import ToolModuleBase, get_config_mgr, lazy_import, load_image_payload
+
+
+# Vision-capable providers, in auto-selection order
+_VISION_PROVIDERS = ("openai", "anthropic", "xai", "gemini", "cohere")
+
+# Delay between launching providers in analyze_image_multi (seconds)
+_MULTI_PROVIDER_STAGGER = 0.1
 
 
 class VisionTools(ToolModuleBase):
@@ -20,54 +28,88 @@ class VisionTools(ToolModuleBase):
     description = "Analyze images using multiple AI providers"
     version = "1.0.0"
 
-    def initialize(self):
-        """Initialize vision tool schemas."""
-        from config import ConfigManager
-        
-        self.config_mgr = ConfigManager()
-        self.available_providers = []
-        
-        # Check which vision providers are available
-        if self.config_mgr.has_api_key('openai'):
-            self.available_providers.append('openai')
-        if self.config_mgr.has_api_key('anthropic'):
-            self.available_providers.append('anthropic')
-        if self.config_mgr.has_api_key('xai'):
-            self.available_providers.append('xai')
-        if self.config_mgr.has_api_key('gemini'):
-            self.available_providers.append('gemini')
-        if self.config_mgr.has_api_key('cohere'):
-            self.available_providers.append('cohere')
-        
-        self.tool_schemas = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "analyze_image",
-                    "description": "Analyze image using best available vision provider",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "image_path": {
-                                "type": "string",
-                                "description": "Path to image file or base64 string"
-                            },
-                            "prompt": {
-                                "type": "string",
-                                "description": "What to analyze or ask about the image"
-                            },
-                            "provider": {
+    _SCHEMAS: List[Dict[str, Any]] = [
+        {
+            "type": "function",
+            "function": {
+                "name": "analyze_image",
+                "description": "Analyze image using best available vision provider",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "image_path": {
+                            "type": "string",
+                            "description": "Path to image file or base64 string"
+                        },
+                        "prompt": {
+                            "type": "string",
+                            "description": "What to analyze or ask about the image"
+                        },
+                        "provider": {
+                            "type": "string",
+                            "description": "Specific provider to use",
+                            "enum": ["auto", "openai", "anthropic", "xai", "gemini", "cohere"],
+                            "default": "auto"
+                        }
+                    },
+                    "required": ["image_path", "prompt"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "analyze_image_multi",
+                "description": "Analyze an image with several vision providers in parallel",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "image_path": {
+                            "type": "string",
+                            "description": "Path to image file or base64 string"
+                        },
+                        "prompt": {
+                            "type": "string",
+                            "description": "What to analyze or ask about the image"
+                        },
+                        "providers": {
+                            "type": "array",
+                            "description": "Providers to query (default: all available)",
+                            "items": {
                                 "type": "string",
-                                "description": "Specific provider to use",
-                                "enum": ["auto", "openai", "anthropic", "xai", "gemini", "cohere"],
-                                "default": "auto"
+                                "enum": ["openai", "anthropic", "xai", "gemini", "cohere"]
                             }
-                        },
-                        "required": ["image_path", "prompt"]
-                    }
+                        }
+                    },
+                    "required": ["image_path", "prompt"]
                 }
             }
-        ]
+        }
+    ]
+
+    def initialize(self):
+        """Initialize vision tool schemas."""
+        self.config_mgr = get_config_mgr()
+
+        # Resolve each provider's key once; order sets the "auto" preference
+        self._api_keys: Dict[str, str] = {}
+        for provider in _VISION_PROVIDERS:
+            api_key = self.config_mgr.get_api_key(provider)
+            if api_key:
+                self._api_keys[provider] = api_key
+        self.available_providers = list(self._api_keys)
+        self._provider_cache: Dict[str, Any] = {}
+        
+        self.tool_schemas = list(self._SCHEMAS)
+
+    def _get_provider(self, name: str) -> Any:
+        """Return the provider instance for name, constructing it on first use."""
+        provider_instance = self._provider_cache.get(name)
+        if provider_instance is None:
+            factory = lazy_import("llm_providers.factory", "ProviderFactory")
+            provider_instance = factory.get_provider(name, api_key=self._api_keys[name])
+            self._provider_cache[name] = provider_instance
+        return provider_instance
 
     def analyze_image(self, image_path: str, prompt: str, provider: str = "auto") -> Dict[str, Any]:
         """
@@ -91,25 +133,60 @@ class VisionTools(ToolModuleBase):
         if provider not in self.available_providers:
             return {"error": f"Provider {provider} not available. Available: {self.available_providers}"}
         
-        # Load image
-        if Path(image_path).exists():
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-        else:
-            # Assume base64
-            image_data = image_path
-        
-        # Get provider instance
-        from llm_providers.factory import ProviderFactory
-        
+        image_data, media_type = load_image_payload(image_path)
+        return self._analyze_with(provider, image_data, prompt, media_type)
+
+    def analyze_image_multi(self, image_path: str, prompt: str,
+                            providers: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Analyze one image with several providers concurrently.
+
+        The image is loaded once and shared. Requests are launched a short
+        interval apart so one provider's request encoding overlaps the
+        previous provider's inference instead of all encoding at once.
+
+        Args:
+            image_path: Path to image or base64 string
+            prompt: Question or analysis request
+            providers: Providers to query (default: all available)
+
+        Returns:
+            Dict with per-provider results keyed by provider name
+        """
+        providers = list(dict.fromkeys(providers or self.available_providers))
+        if not providers:
+            return {"error": "No vision providers available (check API keys)"}
+
+        unavailable = [name for name in providers if name not in self._api_keys]
+        if unavailable:
+            return {"error": f"Providers {unavailable} not available. Available: {self.available_providers}"}
+
+        image_data, media_type = load_image_payload(image_path)
+
+        # A private pool: handlers may already be running on the shared tool pool
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(providers),
+            thread_name_prefix="vision"
+        ) as pool:
+            futures = {}
+            for index, name in enumerate(providers):
+                if index:
+                    time.sleep(_MULTI_PROVIDER_STAGGER)
+                futures[name] = pool.submit(self._analyze_with, name, image_data, prompt, media_type)
+            results = {name: future.result() for name, future in futures.items()}
+
+        return {"results": results, "providers": providers}
+
+    def _analyze_with(self, provider: str, image_data: str, prompt: str,
+                      media_type: Optional[str] = None) -> Dict[str, Any]:
+        """Run one provider's analysis, reporting failures as an error dict."""
+        # Pre-encoded base64 hides the format, so pass along the sniffed type
+        extra = {"media_type": media_type} if media_type else {}
         try:
-            provider_instance = ProviderFactory.get_provider(
-                provider,
-                api_key=self.config_mgr.get_api_key(provider)
-            )
+            provider_instance = self._get_provider(provider)
             
             # Analyze image
-            response = provider_instance.analyze_image(image=image_data, prompt=prompt)
+            response = provider_instance.analyze_image(image=image_data, prompt=prompt, **extra)
 
             result = self._format_completion_response(response)
             result["analysis"] = result.pop("content", "")
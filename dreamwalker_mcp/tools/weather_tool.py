@@ -4,7 +4,8 @@ Tool module for NOAA / National Weather Service data.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional
 
 from .data_tool_base import DataToolModuleBase
 
@@ -20,64 +21,93 @@ class WeatherTools(DataToolModuleBase):
     api_key_name = None
     max_records = 50
 
-    def build_schemas(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "weather_get_current",
-                    "description": "Get current weather for coordinates.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "latitude": {"type": "number", "description": "Latitude in decimal degrees."},
-                            "longitude": {
-                                "type": "number",
-                                "description": "Longitude in decimal degrees.",
-                            },
+    _SCHEMAS: List[Dict[str, Any]] = [
+        {
+            "type": "function",
+            "function": {
+                "name": "weather_get_current",
+                "description": "Get current weather for coordinates.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "latitude": {"type": "number", "description": "Latitude in decimal degrees."},
+                        "longitude": {
+                            "type": "number",
+                            "description": "Longitude in decimal degrees.",
                         },
-                        "required": ["latitude", "longitude"],
                     },
+                    "required": ["latitude", "longitude"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "weather_get_forecast",
-                    "description": "Get multi-day weather forecast for coordinates.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "latitude": {"type": "number"},
-                            "longitude": {"type": "number"},
-                            "periods": {
-                                "type": "integer",
-                                "default": 7,
-                                "description": "Number of forecast periods to return (<=14).",
-                            },
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "weather_get_forecast",
+                "description": "Get multi-day weather forecast for coordinates.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "latitude": {"type": "number"},
+                        "longitude": {"type": "number"},
+                        "periods": {
+                            "type": "integer",
+                            "default": 7,
+                            "description": "Number of forecast periods to return (<=14).",
                         },
-                        "required": ["latitude", "longitude"],
                     },
+                    "required": ["latitude", "longitude"],
+                },
+            },
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "weather_get_alerts",
+                "description": "Get weather alerts for a state.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "state": {
+                            "type": "string",
+                            "description": "Two-letter state code (e.g., OR, WA).",
+                        }
+                    },
+                    "required": ["state"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "weather_get_alerts",
-                    "description": "Get weather alerts for a state.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "state": {
-                                "type": "string",
-                                "description": "Two-letter state code (e.g., OR, WA).",
-                            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "weather_get_overview",
+                "description": (
+                    "Get current conditions, forecast and (optionally) state alerts "
+                    "in one call; the lookups run in parallel."
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "latitude": {"type": "number"},
+                        "longitude": {"type": "number"},
+                        "periods": {
+                            "type": "integer",
+                            "default": 7,
+                            "description": "Number of forecast periods to return (<=14).",
+                        },
+                        "state": {
+                            "type": "string",
+                            "description": "Two-letter state code to include alerts for.",
                         },
-                        "required": ["state"],
                     },
+                    "required": ["latitude", "longitude"],
                 },
             },
-        ]
+        },
+    ]
+
+    def build_schemas(self) -> List[Dict[str, Any]]:
+        return list(self._SCHEMAS)
 
     def weather_get_current(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """Return current weather observations."""
@@ -94,8 +124,9 @@ class WeatherTools(DataToolModuleBase):
         client = self._get_client()
         periods = max(1, min(periods, 14))
         result = client.get_forecast(latitude=latitude, longitude=longitude, periods=periods)
-        periods_data = result.get("periods", [])
-        result["periods"] = self._apply_record_limit(periods_data, limit=periods)
+        forecast = result.get("forecast")
+        if forecast is not None:
+            result["forecast"] = self._apply_record_limit(forecast, limit=periods)
         return result
 
     def weather_get_alerts(self, state: str) -> Dict[str, Any]:
@@ -103,6 +134,22 @@ class WeatherTools(DataToolModuleBase):
         client = self._get_client()
         return client.get_alerts(state=state)
 
+    def weather_get_overview(
+        self,
+        latitude: float,
+        longitude: float,
+        periods: int = 7,
+        state: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return current weather, forecast and alerts fetched concurrently."""
+        calls = {
+            "current": partial(self.weather_get_current, latitude, longitude),
+            "forecast": partial(self.weather_get_forecast, latitude, longitude, periods),
+        }
+        if state:
+            calls["alerts"] = partial(self.weather_get_alerts, state)
+        return self._run_parallel(calls)
+
 
 if __name__ == "__main__":
     WeatherTools.main()
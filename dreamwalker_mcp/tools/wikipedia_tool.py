@@ -4,6 +4,7 @@ Tool module for Wikipedia search and content retrieval.
 
 from __future__ import annotations
 
+from functools import partial
 from typing import Any, Dict, List
 
 from .data_tool_base import DataToolModuleBase
@@ -20,64 +21,81 @@ class WikipediaTools(DataToolModuleBase):
     api_key_name = None
     max_records = 25
 
-    def build_schemas(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "wikipedia_search",
-                    "description": "Search Wikipedia articles.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search keywords."},
-                            "limit": {
-                                "type": "integer",
-                                "default": 10,
-                                "description": "Maximum number of results (<=25).",
-                            },
+    _SCHEMAS: List[Dict[str, Any]] = [
+        {
+            "type": "function",
+            "function": {
+                "name": "wikipedia_search",
+                "description": "Search Wikipedia articles.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search keywords."},
+                        "limit": {
+                            "type": "integer",
+                            "default": 10,
+                            "description": "Maximum number of results (<=25).",
                         },
-                        "required": ["query"],
                     },
+                    "required": ["query"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "wikipedia_get_summary",
-                    "description": "Get a concise summary for a page title.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Article title."},
-                        },
-                        "required": ["title"],
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "wikipedia_get_summary",
+                "description": "Get a concise summary for a page title.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Article title."},
                     },
+                    "required": ["title"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "wikipedia_get_full_content",
-                    "description": "Retrieve the full content for a page title.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "title": {"type": "string", "description": "Article title."},
-                        },
-                        "required": ["title"],
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "wikipedia_get_full_content",
+                "description": "Retrieve the full content for a page title.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Article title."},
                     },
+                    "required": ["title"],
                 },
             },
-        ]
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "wikipedia_get_article",
+                "description": "Retrieve both the summary and full content for a page title in parallel.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string", "description": "Article title."},
+                    },
+                    "required": ["title"],
+                },
+            },
+        },
+    ]
+
+    def build_schemas(self) -> List[Dict[str, Any]]:
+        return list(self._SCHEMAS)
 
     def wikipedia_search(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """Search Wikipedia for matching pages."""
         client = self._get_client()
-        result = client.search(query=query, limit=min(limit, self.max_records or limit))
+        limit = min(limit, self.max_records or limit)
+        result = client.search(query=query, limit=limit)
         result["query"] = query
         search_results = result.get("results") or result.get("pages") or []
-        result["results"] = self._apply_record_limit(search_results)
+        result["results"] = self._apply_record_limit(search_results, limit=limit)
         return result
 
     def wikipedia_get_summary(self, title: str) -> Dict[str, Any]:
@@ -94,6 +112,15 @@ class WikipediaTools(DataToolModuleBase):
         content["title"] = title
         return content
 
+    def wikipedia_get_article(self, title: str) -> Dict[str, Any]:
+        """Retrieve summary and full content concurrently."""
+        return self._run_parallel(
+            {
+                "summary": partial(self.wikipedia_get_summary, title),
+                "content": partial(self.wikipedia_get_full_content, title),
+            }
+        )
+
 
 if __name__ == "__main__":
     WikipediaTools.main()
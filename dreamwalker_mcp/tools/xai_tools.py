@@ -11,9 +11,8 @@ Author: Luke Steuber
 """
 
 from typing import Dict, Any, List
-from pathlib import Path
 
-from .module_base import ToolModuleBase
+from .module_base import ToolModuleBase, get_config_mgr, lazy_import, load_image_payload
 
 
 class XAITools(ToolModuleBase):
@@ -24,103 +23,110 @@ class XAITools(ToolModuleBase):
     description = "xAI Grok models with chat, vision, and Aurora image generation"
     version = "1.0.0"
 
+    _SCHEMAS: List[Dict[str, Any]] = [
+        {
+            "type": "function",
+            "function": {
+                "name": "grok_chat",
+                "description": "Generate chat completion using xAI Grok",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "messages": {
+                            "type": "array",
+                            "description": "List of message objects",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "role": {"type": "string"},
+                                    "content": {"type": "string"}
+                                }
+                            }
+                        },
+                        "model": {
+                            "type": "string",
+                            "description": "Grok model (grok-4, grok-3, grok-2-vision-1212)",
+                            "default": "grok-4"
+                        },
+                        "max_tokens": {"type": "integer", "default": 1024},
+                        "temperature": {"type": "number", "default": 0.7}
+                    },
+                    "required": ["messages"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "grok_vision",
+                "description": "Analyze image using Grok-2-vision",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "image_path": {"type": "string"},
+                        "prompt": {"type": "string"},
+                        "model": {"type": "string", "default": "grok-2-vision-1212"}
+                    },
+                    "required": ["image_path", "prompt"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "grok_generate_image",
+                "description": "Generate image using xAI Aurora",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "prompt": {"type": "string"},
+                        "size": {"type": "string", "default": "1024x1024"}
+                    },
+                    "required": ["prompt"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "grok_list_models",
+                "description": "List available Grok models",
+                "parameters": {"type": "object", "properties": {}}
+            }
+        }
+    ]
+
     def initialize(self):
         """Initialize xAI tool schemas."""
-        from llm_providers.xai_provider import XAIProvider
-        from llm_providers import Message
-        
-        self.Message = Message
-        
         api_key = self.config.get('api_key')
         if not api_key:
-            from config import ConfigManager
-            config = ConfigManager()
-            api_key = config.get_api_key('xai')
+            api_key = get_config_mgr().get_api_key('xai')
 
         if not api_key:
             raise RuntimeError(
                 "xAI API key not configured. Set XAI_API_KEY or provide via config."
             )
         
-        self.provider = XAIProvider(api_key=api_key)
+        # The provider (and its HTTP stack) is only built on the first grok_* call
+        self._api_key = api_key
+        self._provider = None
         
-        self.tool_schemas = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "grok_chat",
-                    "description": "Generate chat completion using xAI Grok",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "messages": {
-                                "type": "array",
-                                "description": "List of message objects",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "role": {"type": "string"},
-                                        "content": {"type": "string"}
-                                    }
-                                }
-                            },
-                            "model": {
-                                "type": "string",
-                                "description": "Grok model (grok-4, grok-3, grok-2-vision-1212)",
-                                "default": "grok-4"
-                            },
-                            "max_tokens": {"type": "integer", "default": 1024},
-                            "temperature": {"type": "number", "default": 0.7}
-                        },
-                        "required": ["messages"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "grok_vision",
-                    "description": "Analyze image using Grok-2-vision",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "image_path": {"type": "string"},
-                            "prompt": {"type": "string"},
-                            "model": {"type": "string", "default": "grok-2-vision-1212"}
-                        },
-                        "required": ["image_path", "prompt"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "grok_generate_image",
-                    "description": "Generate image using xAI Aurora",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "prompt": {"type": "string"},
-                            "size": {"type": "string", "default": "1024x1024"}
-                        },
-                        "required": ["prompt"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "grok_list_models",
-                    "description": "List available Grok models",
-                    "parameters": {"type": "object", "properties": {}}
-                }
-            }
-        ]
+        self.tool_schemas = list(self._SCHEMAS)
+
+    @property
+    def provider(self):
+        """XAIProvider instance, constructed on first use."""
+        provider = self._provider
+        if provider is None:
+            xai_provider = lazy_import("llm_providers.xai_provider", "XAIProvider")
+            provider = self._provider = xai_provider(api_key=self._api_key)
+        return provider
 
     def grok_chat(self, messages: List[Dict], model: str = "grok-4",
                   max_tokens: int = 1024, temperature: float = 0.7) -> Dict[str, Any]:
         """Generate Grok chat completion."""
-        msg_objects = [self.Message(role=m["role"], content=m["content"]) for m in messages]
+        message = lazy_import("llm_providers", "Message")
+        msg_objects = [message(role=m["role"], content=m["content"]) for m in messages]
         response = self.provider.complete(
             msg_objects,
             model=model,
@@ -131,12 +137,8 @@ class XAITools(ToolModuleBase):
 
     def grok_vision(self, image_path: str, prompt: str, model: str = "grok-2-vision-1212") -> Dict[str, Any]:
         """Analyze image with Grok vision."""
-        if Path(image_path).exists():
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-        else:
-            image_data = image_path
-        
+        # Grok takes base64 as-is; its data URL doesn't vary by media type
+        image_data, _ = load_image_payload(image_path)
         response = self.provider.analyze_image(image=image_data, prompt=prompt, model=model)
         analysis_dict = self._format_completion_response(response)
         analysis_dict["analysis"] = analysis_dict.pop("content", "")
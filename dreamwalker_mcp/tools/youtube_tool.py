@@ -20,75 +20,77 @@ class YouTubeTools(DataToolModuleBase):
     api_key_name = "youtube"
     max_records = 25
 
-    def build_schemas(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "youtube_search_videos",
-                    "description": "Search for videos on YouTube.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query."},
-                            "max_results": {
-                                "type": "integer",
-                                "default": 10,
-                                "description": "Maximum number of results (<=25).",
-                            },
-                            "order": {
-                                "type": "string",
-                                "default": "relevance",
-                                "description": "Sort order (date, rating, relevance, title, viewCount).",
-                            },
-                            "safe_search": {
-                                "type": "string",
-                                "default": "moderate",
-                                "description": "Safe search setting (none, moderate, strict).",
-                            },
-                            "video_duration": {
-                                "type": "string",
-                                "description": "Filter by duration (any, short, medium, long).",
-                            },
+    _SCHEMAS: List[Dict[str, Any]] = [
+        {
+            "type": "function",
+            "function": {
+                "name": "youtube_search_videos",
+                "description": "Search for videos on YouTube.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search query."},
+                        "max_results": {
+                            "type": "integer",
+                            "default": 10,
+                            "description": "Maximum number of results (<=25).",
+                        },
+                        "order": {
+                            "type": "string",
+                            "default": "relevance",
+                            "description": "Sort order (date, rating, relevance, title, viewCount).",
+                        },
+                        "safe_search": {
+                            "type": "string",
+                            "default": "moderate",
+                            "description": "Safe search setting (none, moderate, strict).",
+                        },
+                        "video_duration": {
+                            "type": "string",
+                            "description": "Filter by duration (any, short, medium, long).",
                         },
-                        "required": ["query"],
                     },
+                    "required": ["query"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "youtube_channel_statistics",
-                    "description": "Fetch channel statistics for a channel ID.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "channel_id": {"type": "string", "description": "YouTube channel ID."}
-                        },
-                        "required": ["channel_id"],
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "youtube_channel_statistics",
+                "description": "Fetch channel statistics for a channel ID.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "channel_id": {"type": "string", "description": "YouTube channel ID."}
                     },
+                    "required": ["channel_id"],
                 },
             },
-            {
-                "type": "function",
-                "function": {
-                    "name": "youtube_playlist_items",
-                    "description": "List items in a playlist.",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "playlist_id": {"type": "string", "description": "YouTube playlist ID."},
-                            "max_results": {
-                                "type": "integer",
-                                "default": 25,
-                                "description": "Maximum number of items (<=25).",
-                            },
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "youtube_playlist_items",
+                "description": "List items in a playlist.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "playlist_id": {"type": "string", "description": "YouTube playlist ID."},
+                        "max_results": {
+                            "type": "integer",
+                            "default": 25,
+                            "description": "Maximum number of items (<=25).",
                         },
-                        "required": ["playlist_id"],
                     },
+                    "required": ["playlist_id"],
                 },
             },
-        ]
+        },
+    ]
+
+    def build_schemas(self) -> List[Dict[str, Any]]:
+        return list(self._SCHEMAS)
 
     def youtube_search_videos(
         self,
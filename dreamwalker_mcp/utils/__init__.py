@@ -11,6 +11,9 @@ from .file_utils import (
     format_size,
     format_timestamp,
     calculate_hash,
+    calculate_hashes,
+    sha256_ni_available,
+    preferred_hash_algorithm,
     get_file_type,
     get_file_info,
     get_directory_info,
@@ -108,8 +111,11 @@ from .embeddings import (
     EmbeddingResult,
     SimilarityResult,
     EmbeddingGenerator,
+    AnnIndex,
     calculate_similarity,
     find_most_similar,
+    build_centroid,
+    mean_similarity,
     embedding_to_bytes,
     bytes_to_embedding,
     generate_embedding,
@@ -132,6 +138,9 @@ from .data_validation import (
     ensure_fields,
     validate_choices,
     validate_schema,
+    CompiledSchema,
+    compile_schema,
+    validate_compiled,
     coerce_types,
 )
 
@@ -144,13 +153,21 @@ from .rate_limiter import TokenBucket, InMemoryRateLimiter, rate_limit
 # Crypto helpers
 from .crypto import (
     hash_text,
+    fast_hash,
     generate_hmac,
     verify_hmac,
     generate_random_key,
+    generate_token,
     derive_key,
+    derive_key_raw,
+    derive_key_scrypt,
     generate_symmetric_key,
     encrypt_text,
     decrypt_text,
+    encrypt_bytes,
+    decrypt_bytes,
+    encrypt_many,
+    decrypt_many,
     FERNET_AVAILABLE,
 )
 
@@ -4,10 +4,11 @@ Lightweight cryptographic helpers (hashing, HMAC, optional symmetric encryption)
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import hmac
 import secrets
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple, Union
 
 try:
     from cryptography.fernet import Fernet
@@ -16,25 +17,63 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     _FERNET_AVAILABLE = False
 
+try:
+    import xxhash
+
+    _XXHASH_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _XXHASH_AVAILABLE = False
+
+try:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    _PBKDF2_HASHES = {
+        "sha256": hashes.SHA256,
+        "sha512": hashes.SHA512,
+        "sha1": hashes.SHA1,
+    }
+except ImportError:  # pragma: no cover - optional dependency
+    _PBKDF2_HASHES = None
+
 __all__ = [
     "hash_text",
+    "fast_hash",
     "generate_hmac",
     "verify_hmac",
     "generate_random_key",
+    "generate_token",
     "derive_key",
+    "derive_key_raw",
+    "derive_key_scrypt",
     "generate_symmetric_key",
     "encrypt_text",
     "decrypt_text",
+    "encrypt_bytes",
+    "decrypt_bytes",
+    "encrypt_many",
+    "decrypt_many",
     "FERNET_AVAILABLE",
 ]
 
 FERNET_AVAILABLE = _FERNET_AVAILABLE
 
+# Direct constructors for common algorithms, skipping hashlib.new()'s name lookup
+_HASH_CTORS = {
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+    "sha1": hashlib.sha1,
+    "blake2b": hashlib.blake2b,
+}
+
 
 def hash_text(text: str, algorithm: str = "sha256") -> str:
     """
     Hash text using the specified algorithm.
     """
+    ctor = _HASH_CTORS.get(algorithm)
+    if ctor is not None:
+        return ctor(text.encode("utf-8")).hexdigest()
     try:
         hasher = hashlib.new(algorithm)
     except ValueError as exc:  # pragma: no cover - depends on algorithm availability
@@ -43,29 +82,108 @@ def hash_text(text: str, algorithm: str = "sha256") -> str:
     return hasher.hexdigest()
 
 
+def fast_hash(data: Union[str, bytes], *, secure: bool = False) -> str:
+    """
+    Hash data for cache keys, deduplication and other non-security uses.
+
+    Uses xxh3-128 when the optional ``xxhash`` package is installed, otherwise
+    128-bit BLAKE2b. Pass ``secure=True`` for BLAKE2b regardless; anything
+    that needs a standard digest (HMAC, PBKDF2, interop) should keep using
+    hash_text / generate_hmac with SHA-256.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if _XXHASH_AVAILABLE and not secure:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 def generate_hmac(message: str, secret: str, algorithm: str = "sha256") -> str:
     """
     Generate a hex-encoded HMAC signature for message.
     """
-    digest = hmac.new(secret.encode("utf-8"), message.encode("utf-8"), algorithm)
-    return digest.hexdigest()
+    return hmac.new(
+        secret.encode("utf-8"), message.encode("utf-8"), _HASH_CTORS.get(algorithm, algorithm)
+    ).hexdigest()
 
 
 def verify_hmac(message: str, secret: str, signature: str, algorithm: str = "sha256") -> bool:
     """
     Verify an HMAC signature using constant time comparison.
     """
-    expected = generate_hmac(message, secret, algorithm)
-    return hmac.compare_digest(expected, signature)
+    expected = hmac.new(
+        secret.encode("utf-8"), message.encode("utf-8"), _HASH_CTORS.get(algorithm, algorithm)
+    ).digest()
+    # Compare raw digests; the length check also rejects fromhex's embedded whitespace
+    if len(signature) != 2 * len(expected):
+        return False
+    try:
+        provided = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected, provided)
 
 
 def generate_random_key(length: int = 32) -> str:
     """
     Generate a random hexadecimal key of desired length.
+
+    For new tokens prefer generate_token(), which packs the same entropy
+    into fewer characters.
     """
     if length <= 0:
         raise ValueError("length must be positive")
-    return secrets.token_hex(length // 2 if length % 2 == 0 else length)
+    # Round odd lengths up to whole bytes and trim, so the result is exactly length chars
+    return secrets.token_hex((length + 1) // 2)[:length]
+
+
+def generate_token(nbytes: int = 32) -> str:
+    """
+    Generate a URL-safe base64 token carrying nbytes of randomness.
+    """
+    if nbytes <= 0:
+        raise ValueError("nbytes must be positive")
+    return secrets.token_urlsafe(nbytes)
+
+
+def _pbkdf2_via_cryptography(
+    algorithm: str, password: bytes, salt: bytes, iterations: int, dklen: int
+) -> bytes:
+    """PBKDF2-HMAC through OpenSSL's one-shot implementation in cryptography."""
+    hash_cls = _PBKDF2_HASHES.get(algorithm)
+    if hash_cls is None:
+        return hashlib.pbkdf2_hmac(algorithm, password, salt, iterations, dklen=dklen)
+    kdf = PBKDF2HMAC(algorithm=hash_cls(), length=dklen, salt=salt, iterations=iterations)
+    return kdf.derive(password)
+
+
+# Same signature as hashlib.pbkdf2_hmac; prefer cryptography when installed
+_PBKDF2 = _pbkdf2_via_cryptography if _PBKDF2_HASHES is not None else hashlib.pbkdf2_hmac
+
+
+def derive_key_raw(
+    password: bytes,
+    *,
+    salt: Optional[bytes] = None,
+    iterations: int = 100_000,
+    length: int = 32,
+    algorithm: str = "sha256",
+) -> Tuple[bytes, bytes]:
+    """
+    Derive a key from a password using PBKDF2-HMAC, without hex encoding.
+
+    Returns a tuple of (derived_key, salt) as raw bytes, for callers that
+    store binary keys.
+    """
+    salt_bytes = salt if salt else secrets.token_bytes(16)
+    derived = _PBKDF2(
+        algorithm,
+        password,
+        salt_bytes,
+        iterations,
+        dklen=length,
+    )
+    return derived, salt_bytes
 
 
 def derive_key(
@@ -81,12 +199,42 @@ def derive_key(
 
     Returns a tuple of (derived_key_hex, salt_hex).
     """
+    derived, salt_bytes = derive_key_raw(
+        password.encode("utf-8"),
+        salt=bytes.fromhex(salt) if salt else None,
+        iterations=iterations,
+        length=length,
+        algorithm=algorithm,
+    )
+    return derived.hex(), salt_bytes.hex()
+
+
+def derive_key_scrypt(
+    password: str,
+    *,
+    salt: Optional[str] = None,
+    n: int = 2 ** 14,
+    r: int = 8,
+    p: int = 1,
+    length: int = 32,
+) -> Tuple[str, str]:
+    """
+    Derive a key from a password using scrypt (memory-hard, unlike PBKDF2).
+
+    Keys are not interchangeable with derive_key output; store which KDF was
+    used alongside the salt.
+
+    Returns a tuple of (derived_key_hex, salt_hex).
+    """
+    if not hasattr(hashlib, "scrypt"):  # pragma: no cover - depends on OpenSSL build
+        raise RuntimeError("hashlib.scrypt requires Python built against OpenSSL 1.1+")
     salt_bytes = bytes.fromhex(salt) if salt else secrets.token_bytes(16)
-    derived = hashlib.pbkdf2_hmac(
-        algorithm,
+    derived = hashlib.scrypt(
         password.encode("utf-8"),
-        salt_bytes,
-        iterations,
+        salt=salt_bytes,
+        n=n,
+        r=r,
+        p=p,
         dklen=length,
     )
     return derived.hex(), salt_bytes.hex()
@@ -101,24 +249,59 @@ def generate_symmetric_key() -> str:
     return Fernet.generate_key().decode("utf-8")
 
 
-def encrypt_text(text: str, key: str) -> str:
+@functools.lru_cache(maxsize=32)
+def _fernet(key: str) -> "Fernet":
+    """Return a Fernet for key, reusing the parsed instance across calls."""
+    return Fernet(key.encode("utf-8"))
+
+
+def encrypt_bytes(data: bytes, key: str) -> bytes:
     """
-    Encrypt text using Fernet symmetric encryption.
+    Encrypt raw bytes using Fernet symmetric encryption, returning the token bytes.
+    """
+    if not _FERNET_AVAILABLE:
+        raise RuntimeError("cryptography package not installed; install 'cryptography' to use Fernet")
+    return _fernet(key).encrypt(data)
+
+
+def decrypt_bytes(token: bytes, key: str) -> bytes:
+    """
+    Decrypt a Fernet token given as bytes, returning the raw plaintext bytes.
     """
     if not _FERNET_AVAILABLE:
         raise RuntimeError("cryptography package not installed; install 'cryptography' to use Fernet")
-    fernet = Fernet(key.encode("utf-8"))
-    token = fernet.encrypt(text.encode("utf-8"))
-    return token.decode("utf-8")
+    return _fernet(key).decrypt(token)
+
+
+def encrypt_text(text: str, key: str) -> str:
+    """
+    Encrypt text using Fernet symmetric encryption.
+    """
+    return encrypt_bytes(text.encode("utf-8"), key).decode("utf-8")
 
 
 def decrypt_text(token: str, key: str) -> str:
     """
     Decrypt text using Fernet symmetric encryption.
     """
+    return decrypt_bytes(token.encode("utf-8"), key).decode("utf-8")
+
+
+def encrypt_many(texts: Iterable[str], key: str) -> List[str]:
+    """
+    Encrypt several strings with one key, returning tokens in input order.
+    """
     if not _FERNET_AVAILABLE:
         raise RuntimeError("cryptography package not installed; install 'cryptography' to use Fernet")
-    fernet = Fernet(key.encode("utf-8"))
-    plaintext = fernet.decrypt(token.encode("utf-8"))
-    return plaintext.decode("utf-8")
+    encrypt = _fernet(key).encrypt
+    return [encrypt(text.encode("utf-8")).decode("utf-8") for text in texts]
 
+
+def decrypt_many(tokens: Iterable[str], key: str) -> List[str]:
+    """
+    Decrypt several Fernet tokens with one key, returning plaintexts in input order.
+    """
+    if not _FERNET_AVAILABLE:
+        raise RuntimeError("cryptography package not installed; install 'cryptography' to use Fernet")
+    decrypt = _fernet(key).decrypt
+    return [decrypt(token.encode("utf-8")).decode("utf-8") for token in tokens]
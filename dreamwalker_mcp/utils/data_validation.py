@@ -4,8 +4,9 @@ Data validation helpers for lightweight schema enforcement.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 __all__ = [
     "ValidationError",
@@ -13,10 +14,23 @@ __all__ = [
     "ensure_fields",
     "validate_choices",
     "validate_schema",
+    "CompiledSchema",
+    "compile_schema",
+    "validate_compiled",
     "coerce_types",
 ]
 
 
+# Concrete type checks for schema "type" values; avoids ABC isinstance dispatch
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda data: isinstance(data, dict),
+    "array": lambda data: isinstance(data, (list, tuple)),
+    "string": lambda data: isinstance(data, str),
+    "number": lambda data: isinstance(data, (int, float)) and not isinstance(data, bool),
+    "boolean": lambda data: isinstance(data, bool),
+}
+
+
 class ValidationError(Exception):
     """Raised when validation fails."""
 
@@ -41,6 +55,44 @@ def ensure_fields(data: Mapping[str, Any], required_fields: Iterable[str]) -> No
         raise ValidationError(f"Missing required fields: {', '.join(missing)}")
 
 
+def _frozen_choices(choices: Iterable[Any]) -> Optional[frozenset]:
+    """Return choices as a frozenset, or None if any element is unhashable."""
+    try:
+        return frozenset(choices)
+    except TypeError:
+        return None
+
+
+_cached_frozen_choices = functools.lru_cache(maxsize=256)(_frozen_choices)
+
+
+def _is_member(value: Any, choices: Any) -> bool:
+    """
+    ``value in choices`` with O(1) lookups where possible.
+
+    Sets are used directly and hashable sequences (tuples) are converted to
+    a cached frozenset. Lists, which can't be cached safely, and unhashable
+    values fall back to a linear scan.
+    """
+    if isinstance(choices, (set, frozenset)):
+        lookup = choices
+    elif isinstance(choices, tuple):
+        try:
+            lookup = _cached_frozen_choices(choices)
+        except TypeError:
+            lookup = None
+    else:
+        lookup = None
+    if lookup is not None:
+        try:
+            return value in lookup
+        except TypeError:
+            # Unhashable values can't be members of a set
+            if lookup is choices:
+                return False
+    return value in choices
+
+
 def validate_choices(
     data: Mapping[str, Any],
     field: str,
@@ -63,17 +115,44 @@ def validate_choices(
     value = data.get(field)
     if value is None and allow_none:
         return
-    if value not in choices:
+    if not _is_member(value, choices):
         raise ValidationError(
             f"Field '{field}' must be one of {choices!r}; received {value!r}"
         )
 
 
+class _ValidationBudgetExceeded(Exception):
+    """Unwinds the validation walk once the error budget is spent."""
+
+
+class _BudgetedErrors(list):
+    """Error list that stops the walk when it reaches max_errors entries."""
+
+    __slots__ = ("max_errors",)
+
+    def __init__(self, max_errors: int) -> None:
+        super().__init__()
+        self.max_errors = max_errors
+
+    def append(self, error: str) -> None:
+        super().append(error)
+        if len(self) >= self.max_errors:
+            raise _ValidationBudgetExceeded
+
+
+def _new_error_list(max_errors: Optional[int]) -> List[str]:
+    """Return the error list for a walk, budgeted when max_errors is set."""
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("max_errors must be at least 1")
+    return _BudgetedErrors(max_errors) if max_errors else []
+
+
 def validate_schema(
     data: Any,
     schema: Dict[str, Any],
     *,
     path: str = "root",
+    max_errors: Optional[int] = None,
 ) -> List[str]:
     """
     Validate a Python structure against a minimal JSON-schema-like dict.
@@ -85,105 +164,317 @@ def validate_schema(
         data: Data to validate.
         schema: Schema definition dictionary.
         path: Current traversal path for error messages.
+        max_errors: Stop validating once this many errors are found;
+            ``max_errors=1`` gives fail-fast pass/fail checks for hot paths.
 
     Returns:
         List of human-readable validation errors.
     """
-    errors: List[str] = []
-    expected_type = schema.get("type")
+    errors = _new_error_list(max_errors)
+    try:
+        _walk(data, schema, path, errors)
+    except _ValidationBudgetExceeded:
+        pass
+    return list(errors) if max_errors else errors
+
+
+# A validation path as nested (parent, key-or-index) pairs down from the
+# root string, so descending a level allocates one small tuple and the
+# dotted string is only built when an error is reported.
+_Path = Union[str, Tuple[Any, Any]]
+
+
+def _format_path(path: _Path) -> str:
+    """Render a nested path as e.g. ``root.items[2].name``."""
+    segments = []
+    while isinstance(path, tuple):
+        path, segment = path
+        segments.append(f"[{segment}]" if isinstance(segment, int) else f".{segment}")
+    segments.append(path)
+    return "".join(reversed(segments))
+
+
+def _walk(data: Any, schema: Dict[str, Any], path: _Path, errors: List[str]) -> None:
+    """Validate one node of validate_schema, appending to a shared error list."""
+    get = schema.get
+    expected_type = get("type")
 
     if expected_type:
-        if expected_type == "object" and not isinstance(data, Mapping):
-            errors.append(f"{path}: expected object, got {type(data).__name__}")
-            return errors
-        if expected_type == "array" and not isinstance(data, Sequence):
-            errors.append(f"{path}: expected array, got {type(data).__name__}")
-            return errors
-        if expected_type == "string" and not isinstance(data, str):
-            errors.append(f"{path}: expected string, got {type(data).__name__}")
-            return errors
-        if expected_type == "number" and not isinstance(data, (int, float)):
-            errors.append(f"{path}: expected number, got {type(data).__name__}")
-            return errors
-        if expected_type == "boolean" and not isinstance(data, bool):
-            errors.append(f"{path}: expected boolean, got {type(data).__name__}")
-            return errors
-
-    if isinstance(data, Mapping):
-        required = schema.get("required", [])
-        for key in required:
+        type_check = _TYPE_CHECKS.get(expected_type)
+        if type_check is not None and not type_check(data):
+            errors.append(f"{_format_path(path)}: expected {expected_type}, got {type(data).__name__}")
+            return
+
+    if isinstance(data, dict):
+        for key in get("required", ()):
             if key not in data:
-                errors.append(f"{path}.{key}: missing required field")
+                errors.append(f"{_format_path(path)}.{key}: missing required field")
 
-        properties = schema.get("properties", {})
-        for key, subschema in properties.items():
-            if key in data:
-                errors.extend(
-                    validate_schema(
-                        data[key],
-                        subschema,
-                        path=f"{path}.{key}",
-                    )
-                )
-
-    if isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
-        item_schema = schema.get("items")
+        properties = get("properties")
+        if properties:
+            for key, subschema in properties.items():
+                if key in data:
+                    _walk(data[key], subschema, (path, key), errors)
+
+    elif isinstance(data, (list, tuple)):
+        item_schema = get("items")
         if item_schema:
             for idx, item in enumerate(data):
-                errors.extend(
-                    validate_schema(
-                        item,
-                        item_schema,
-                        path=f"{path}[{idx}]",
-                    )
-                )
-
-    if isinstance(data, str):
-        min_length = schema.get("minLength")
-        max_length = schema.get("maxLength")
+                _walk(item, item_schema, (path, idx), errors)
+
+    elif isinstance(data, str):
+        min_length = get("minLength")
+        max_length = get("maxLength")
         if min_length is not None and len(data) < min_length:
-            errors.append(f"{path}: length {len(data)} < minimum {min_length}")
+            errors.append(f"{_format_path(path)}: length {len(data)} < minimum {min_length}")
         if max_length is not None and len(data) > max_length:
-            errors.append(f"{path}: length {len(data)} > maximum {max_length}")
+            errors.append(f"{_format_path(path)}: length {len(data)} > maximum {max_length}")
 
-    if isinstance(data, (int, float)):
-        minimum = schema.get("minimum")
-        maximum = schema.get("maximum")
+    elif isinstance(data, (int, float)):
+        minimum = get("minimum")
+        maximum = get("maximum")
         if minimum is not None and data < minimum:
-            errors.append(f"{path}: value {data} < minimum {minimum}")
+            errors.append(f"{_format_path(path)}: value {data} < minimum {minimum}")
         if maximum is not None and data > maximum:
-            errors.append(f"{path}: value {data} > maximum {maximum}")
+            errors.append(f"{_format_path(path)}: value {data} > maximum {maximum}")
 
-    enum = schema.get("enum")
-    if enum is not None and data not in enum:
-        errors.append(f"{path}: value {data!r} not in enum {enum!r}")
+    enum = get("enum")
+    if enum is not None and not _is_member(data, enum):
+        errors.append(f"{_format_path(path)}: value {data!r} not in enum {enum!r}")
 
-    return errors
+
+@dataclass
+class CompiledSchema:
+    """
+    Schema pre-resolved by compile_schema for repeated validation.
+
+    Keyword lookups are done once at compile time; properties become a
+    tuple of (key, CompiledSchema) pairs.
+    """
+
+    __slots__ = (
+        "type",
+        "type_check",
+        "required",
+        "properties",
+        "items",
+        "enum",
+        "enum_set",
+        "min_length",
+        "max_length",
+        "minimum",
+        "maximum",
+    )
+
+    type: Optional[str]
+    type_check: Optional[Callable[[Any], bool]]
+    required: Tuple[str, ...]
+    properties: Tuple[Tuple[str, "CompiledSchema"], ...]
+    items: Optional["CompiledSchema"]
+    enum: Optional[Sequence[Any]]
+    enum_set: Optional[frozenset]
+    min_length: Optional[int]
+    max_length: Optional[int]
+    minimum: Optional[float]
+    maximum: Optional[float]
+
+
+def _compile(schema: Dict[str, Any]) -> CompiledSchema:
+    """Recursively resolve a schema dict into a CompiledSchema."""
+    get = schema.get
+    expected_type = get("type")
+    item_schema = get("items")
+    enum = get("enum")
+    return CompiledSchema(
+        type=expected_type,
+        type_check=_TYPE_CHECKS.get(expected_type) if expected_type else None,
+        required=tuple(get("required", ())),
+        properties=tuple(
+            (key, _compile(subschema))
+            for key, subschema in (get("properties") or {}).items()
+        ),
+        items=_compile(item_schema) if item_schema else None,
+        enum=enum,
+        enum_set=_frozen_choices(enum) if enum is not None else None,
+        min_length=get("minLength"),
+        max_length=get("maxLength"),
+        minimum=get("minimum"),
+        maximum=get("maximum"),
+    )
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable snapshot of a JSON-like value, used as a cache key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return ("__seq__",) + tuple(_freeze(item) for item in value)
+    return value
+
+
+class _SchemaKey:
+    """Cache key carrying the original schema alongside its frozen form."""
+
+    __slots__ = ("schema", "frozen")
+
+    def __init__(self, schema: Dict[str, Any], frozen: Any) -> None:
+        self.schema = schema
+        self.frozen = frozen
+
+    def __hash__(self) -> int:
+        return hash(self.frozen)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _SchemaKey) and self.frozen == other.frozen
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(key: _SchemaKey) -> CompiledSchema:
+    """Compile once per distinct (frozen) schema."""
+    return _compile(key.schema)
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledSchema:
+    """
+    Compile a schema for validate_compiled().
+
+    Equal schemas share one compiled object. Compile once and reuse it when
+    validating many records against the same schema.
+
+    Args:
+        schema: Schema definition dictionary (see validate_schema).
+
+    Returns:
+        CompiledSchema instance.
+    """
+    try:
+        key = _SchemaKey(schema, _freeze(schema))
+        hash(key)
+    except TypeError:
+        # Unhashable leaf values: compile without caching
+        return _compile(schema)
+    return _compile_cached(key)
+
+
+def validate_compiled(
+    data: Any,
+    schema: CompiledSchema,
+    *,
+    path: str = "root",
+    max_errors: Optional[int] = None,
+) -> List[str]:
+    """
+    Validate data against a compiled schema.
+
+    Same rules and messages as validate_schema.
+
+    Args:
+        data: Data to validate.
+        schema: Schema from compile_schema().
+        path: Current traversal path for error messages.
+        max_errors: Stop validating once this many errors are found.
+
+    Returns:
+        List of human-readable validation errors.
+    """
+    errors = _new_error_list(max_errors)
+    try:
+        _walk_compiled(data, schema, path, errors)
+    except _ValidationBudgetExceeded:
+        pass
+    return list(errors) if max_errors else errors
+
+
+def _in_compiled_enum(data: Any, schema: CompiledSchema) -> bool:
+    """Enum membership using the frozenset built at compile time."""
+    enum_set = schema.enum_set
+    if enum_set is not None:
+        try:
+            return data in enum_set
+        except TypeError:
+            pass
+    return data in schema.enum
+
+
+def _walk_compiled(data: Any, schema: CompiledSchema, path: _Path, errors: List[str]) -> None:
+    """Compiled counterpart of _walk."""
+    type_check = schema.type_check
+    if type_check is not None and not type_check(data):
+        errors.append(f"{_format_path(path)}: expected {schema.type}, got {type(data).__name__}")
+        return
+
+    if isinstance(data, dict):
+        for key in schema.required:
+            if key not in data:
+                errors.append(f"{_format_path(path)}.{key}: missing required field")
+        for key, subschema in schema.properties:
+            if key in data:
+                _walk_compiled(data[key], subschema, (path, key), errors)
+
+    elif isinstance(data, (list, tuple)):
+        item_schema = schema.items
+        if item_schema is not None:
+            for idx, item in enumerate(data):
+                _walk_compiled(item, item_schema, (path, idx), errors)
+
+    elif isinstance(data, str):
+        min_length = schema.min_length
+        max_length = schema.max_length
+        if min_length is not None and len(data) < min_length:
+            errors.append(f"{_format_path(path)}: length {len(data)} < minimum {min_length}")
+        if max_length is not None and len(data) > max_length:
+            errors.append(f"{_format_path(path)}: length {len(data)} > maximum {max_length}")
+
+    elif isinstance(data, (int, float)):
+        minimum = schema.minimum
+        maximum = schema.maximum
+        if minimum is not None and data < minimum:
+            errors.append(f"{_format_path(path)}: value {data} < minimum {minimum}")
+        if maximum is not None and data > maximum:
+            errors.append(f"{_format_path(path)}: value {data} > maximum {maximum}")
+
+    enum = schema.enum
+    if enum is not None and not _in_compiled_enum(data, schema):
+        errors.append(f"{_format_path(path)}: value {data!r} not in enum {enum!r}")
 
 
 def coerce_types(
     data: Mapping[str, Any],
     field_types: Mapping[str, Callable[[Any], Any]],
-) -> Dict[str, Any]:
+    *,
+    copy: bool = True,
+) -> Mapping[str, Any]:
     """
     Coerce mapping values to specific types.
 
     Args:
         data: Original mapping.
         field_types: Mapping of field names to callables that coerce the value.
+        copy: Always return a new dictionary. With ``copy=False`` the mapping
+            is copied only when a value actually changes, and ``data`` itself
+            is returned when every value was already coerced.
 
     Returns:
-        New dictionary with coerced values.
+        Dictionary with coerced values (``data`` itself when ``copy=False``
+        and nothing changed).
 
     Raises:
         ValidationError: When coercion fails.
     """
-    coerced: Dict[str, Any] = dict(data)
+    coerced: Optional[Dict[str, Any]] = None
     for field, converter in field_types.items():
-        if field in data and data[field] is not None:
-            try:
-                coerced[field] = converter(data[field])
-            except Exception as exc:
-                raise ValidationError(f"Failed to coerce '{field}': {exc}") from exc
-    return coerced
-
+        value = data.get(field)
+        if value is None:
+            continue
+        try:
+            converted = converter(value)
+        except Exception as exc:
+            raise ValidationError(f"Failed to coerce '{field}': {exc}") from exc
+        if converted is value:
+            continue
+        if coerced is None:
+            coerced = dict(data)
+        coerced[field] = converted
+    if coerced is not None:
+        return coerced
+    return dict(data) if copy else data
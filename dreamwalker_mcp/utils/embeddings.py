@@ -31,8 +31,12 @@ Usage:
 Author: Luke Steuber
 """
 
+import asyncio
+import functools
 import os
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Union, Dict, Any
 
@@ -45,6 +49,30 @@ except ImportError:
     np_norm = None
     NUMPY_AVAILABLE = False
 
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores_numba(query, candidates):
+        """Cosine of a unit-length query against each row, norms fused into the dot loop."""
+        count, dims = candidates.shape
+        scores = np.empty(count, dtype=np.float32)
+        for i in numba.prange(count):
+            dot = 0.0
+            squares = 0.0
+            for j in range(dims):
+                value = candidates[i, j]
+                dot += query[j] * value
+                squares += value * value
+            scores[i] = dot / np.sqrt(squares) if squares > 0.0 else 0.0
+        return scores
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    _cosine_scores_numba = None
+    NUMBA_AVAILABLE = False
+
 try:
     import ollama
     OLLAMA_AVAILABLE = True
@@ -53,12 +81,22 @@ except ImportError:
     OLLAMA_AVAILABLE = False
 
 try:
-    from openai import OpenAI
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    hnswlib = None
+    HNSWLIB_AVAILABLE = False
+
+try:
+    from openai import AsyncOpenAI, OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
+    AsyncOpenAI = None
     OpenAI = None
     OPENAI_AVAILABLE = False
 
+from .retry_logic import RetryConfig
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +116,7 @@ class EmbeddingResult:
         dimensions: Embedding dimensionality
         success: Whether generation succeeded
         error: Error message if failed
+        normalized: Whether the embedding was scaled to unit L2 norm
     """
     embedding: Optional['np.ndarray']
     model: str
@@ -85,6 +124,7 @@ class EmbeddingResult:
     dimensions: Optional[int] = None
     success: bool = True
     error: Optional[str] = None
+    normalized: bool = False
 
 
 @dataclass
@@ -104,6 +144,54 @@ class SimilarityResult:
     metadata: Optional[Dict[str, Any]] = field(default_factory=dict)
 
 
+# ============================================================================
+# Helpers
+# ============================================================================
+
+# Backoff for rate-limited (HTTP 429) embedding requests
+RATE_LIMIT_RETRY = RetryConfig(max_attempts=4, delay=1.0, backoff=2.0)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether a provider error is an HTTP 429 (openai and ollama set status_code)."""
+    return getattr(error, "status_code", None) == 429
+
+
+def _single_vector(embeddings: Any) -> 'np.ndarray':
+    """Parse a single-input embeddings payload ([[...]] or [...]) into a 1-D float32 array."""
+    vector = np.asarray(embeddings, dtype=np.float32)
+    if vector.ndim == 2 and vector.shape[0] == 1:
+        vector = vector[0]
+    if vector.ndim != 1:
+        raise ValueError(f"Expected a single embedding, got shape {vector.shape}")
+    return vector
+
+
+def _as_float32(vector: 'np.ndarray') -> 'np.ndarray':
+    """
+    Return vector as a contiguous, aligned float32 array (no copy if it already is).
+
+    Other layouts (float64, strided views, misaligned np.frombuffer results)
+    make numpy skip the BLAS sdot kernel.
+    """
+    if (
+        isinstance(vector, np.ndarray)
+        and vector.dtype == np.float32
+        and vector.flags.c_contiguous
+        and vector.flags.aligned
+    ):
+        return vector
+    return np.require(vector, dtype=np.float32, requirements=("C", "A"))
+
+
+def _normalize(vector: 'np.ndarray') -> 'np.ndarray':
+    """Scale a vector to unit L2 norm (zero vectors are returned unchanged)."""
+    length = np_norm(vector)
+    if length == 0:
+        return vector
+    return vector / length
+
+
 # ============================================================================
 # Embedding Generator
 # ============================================================================
@@ -119,12 +207,17 @@ class EmbeddingGenerator:
         768
     """
 
+    # Inputs per request for providers that accept a list of texts
+    MAX_BATCH: Dict[str, int] = {"ollama": 96, "openai": 2048, "custom": 2048}
+
     def __init__(
         self,
         provider: str = "ollama",
         model: str = "nomic-embed-text:latest",
         api_key: Optional[str] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        normalize: bool = True,
+        max_workers: int = 8
     ):
         """
         Initialize embedding generator.
@@ -134,6 +227,10 @@ class EmbeddingGenerator:
             model: Model name
             api_key: API key for OpenAI or custom provider
             base_url: Base URL for custom provider
+            normalize: Store embeddings scaled to unit length, so cosine
+                similarity reduces to a dot product (False keeps raw vectors)
+            max_workers: Concurrent requests when texts must be embedded
+                one at a time
 
         Raises:
             ImportError: If required libraries not installed
@@ -146,6 +243,9 @@ class EmbeddingGenerator:
         self.model = model
         self.api_key = api_key
         self.base_url = base_url
+        self.normalize = normalize
+        self.max_workers = max_workers
+        self._aclient = None  # (event loop, async client) from the last async call
 
         # Validate provider
         if self.provider == "ollama":
@@ -185,38 +285,11 @@ class EmbeddingGenerator:
             (768,)
         """
         try:
-            if self.provider == "ollama":
-                resp = ollama.embed(model=self.model, input=text)
-                emb = resp["embeddings"]
-                if isinstance(emb, list) and len(emb) > 0:
-                    emb = emb[0] if isinstance(emb[0], list) else emb
-                embedding = np.array(emb, dtype=np.float32)
-
-            elif self.provider in {"openai", "custom"}:
-                resp = self.client.embeddings.create(
-                    input=text,
-                    model=self.model
-                )
-                embedding = np.array(resp.data[0].embedding, dtype=np.float32)
-
-            else:
-                return EmbeddingResult(
-                    embedding=None,
-                    model=self.model,
-                    provider=self.provider,
-                    success=False,
-                    error=f"Unsupported provider: {self.provider}"
-                )
+            embedding = self._embed_with_backoff(text)
 
             logger.debug(f"Generated embedding: dim={embedding.shape[0]}")
 
-            return EmbeddingResult(
-                embedding=embedding,
-                model=self.model,
-                provider=self.provider,
-                dimensions=embedding.shape[0],
-                success=True
-            )
+            return self._to_result(embedding)
 
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
@@ -232,6 +305,11 @@ class EmbeddingGenerator:
         """
         Generate embeddings for multiple texts.
 
+        Texts are sent in batched requests (up to MAX_BATCH per call); if a
+        batch fails, or the provider has no batch size, texts are embedded
+        one request each, max_workers at a time. Successful embeddings are
+        row views into one contiguous (N, D) buffer.
+
         Args:
             texts: List of texts to embed
 
@@ -243,12 +321,422 @@ class EmbeddingGenerator:
             >>> print(len(results))
             2
         """
-        results = []
-        for text in texts:
-            result = self.generate(text)
-            results.append(result)
+        results, _ = self._generate_into_buffer(list(texts))
         return results
 
+    def generate_batch_matrix(self, texts: List[str]) -> 'np.ndarray':
+        """
+        Generate embeddings for multiple texts as one 2-D float32 matrix.
+
+        Rows follow the input order; the matrix can be passed straight to
+        find_most_similar() as candidate_embeddings.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array of shape (len(texts), dimensions)
+
+        Raises:
+            ValueError: If any text fails to embed
+
+        Example:
+            >>> matrix = generator.generate_batch_matrix(["Hello", "World"])
+            >>> print(matrix.shape)
+            (2, 768)
+        """
+        results, matrix = self._generate_into_buffer(list(texts))
+        errors = [result.error for result in results if not result.success]
+        if errors:
+            raise ValueError(
+                f"Embedding generation failed for {len(errors)} of {len(results)} texts: {errors[0]}"
+            )
+        return matrix
+
+    def _generate_into_buffer(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[EmbeddingResult], 'np.ndarray']:
+        """
+        Embed texts into rows of one preallocated (N, D) float32 buffer.
+
+        The buffer is allocated once the first vector gives the dimension;
+        successful results hold row views into it. Failed rows are left
+        unset.
+        """
+        count = len(texts)
+        results: List[Optional[EmbeddingResult]] = [None] * count
+        buffer = None
+
+        def store(index: int, vector: Any, normalized: bool) -> None:
+            nonlocal buffer
+            if buffer is None:
+                buffer = np.empty((count, len(vector)), dtype=np.float32)
+            row = buffer[index]
+            try:
+                row[:] = vector
+            except ValueError as e:
+                results[index] = EmbeddingResult(
+                    embedding=None,
+                    model=self.model,
+                    provider=self.provider,
+                    success=False,
+                    error=f"Inconsistent embedding dimensions: {e}"
+                )
+                return
+            if self.normalize and not normalized:
+                length = np_norm(row)
+                if length:
+                    row /= length
+            results[index] = EmbeddingResult(
+                embedding=row,
+                model=self.model,
+                provider=self.provider,
+                dimensions=row.shape[0],
+                success=True,
+                normalized=self.normalize
+            )
+
+        batch_size = self.MAX_BATCH.get(self.provider)
+        pending = [] if batch_size else list(range(count))
+        if batch_size:
+            for start in range(0, count, batch_size):
+                chunk = texts[start:start + batch_size]
+                try:
+                    vectors = self._embed_many(chunk)
+                    if len(vectors) != len(chunk):
+                        raise ValueError(
+                            f"Expected {len(chunk)} embeddings, got {len(vectors)}"
+                        )
+                except Exception as e:
+                    # Fall back to one request per text so errors stay per item
+                    logger.warning(f"Batch embedding failed, retrying individually: {e}")
+                    pending.extend(range(start, start + len(chunk)))
+                    continue
+                for offset, vector in enumerate(vectors):
+                    store(start + offset, vector, False)
+
+        if pending:
+            singles = self._generate_each([texts[index] for index in pending])
+            for index, result in zip(pending, singles):
+                if result.success:
+                    store(index, result.embedding, True)
+                else:
+                    results[index] = result
+
+        if buffer is None:
+            buffer = np.empty((count, 0), dtype=np.float32)
+        return results, buffer
+
+    def _generate_each(self, texts: List[str]) -> List[EmbeddingResult]:
+        """Embed texts one request each, overlapping the requests on a thread pool."""
+        if len(texts) <= 1 or self.max_workers <= 1:
+            return [self.generate(text) for text in texts]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(texts))) as pool:
+            return list(pool.map(self.generate, texts))
+
+    def _embed_with_backoff(self, text: str) -> 'np.ndarray':
+        """Embed one text, backing off and retrying when rate limited (HTTP 429)."""
+        config = RATE_LIMIT_RETRY
+        for attempt in range(config.max_attempts):
+            try:
+                return self._embed_one(text)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= config.max_attempts - 1:
+                    raise
+                sleep_time = config.compute_delay(attempt)
+                logger.warning(f"Embedding rate limited, retrying in {sleep_time:.2f}s")
+                time.sleep(sleep_time)
+        raise RuntimeError("Embedding retry loop exited without a result")
+
+    def _embed_one(self, text: str) -> 'np.ndarray':
+        """Embed a single text with one provider request."""
+        if self.provider == "ollama":
+            resp = ollama.embed(model=self.model, input=text)
+            return _single_vector(resp["embeddings"])
+
+        if self.provider in {"openai", "custom"}:
+            resp = self.client.embeddings.create(
+                input=text,
+                model=self.model
+            )
+            return np.array(resp.data[0].embedding, dtype=np.float32)
+
+        raise ValueError(f"Unsupported provider: {self.provider}")
+
+    def _embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts with one provider request."""
+        if self.provider == "ollama":
+            resp = ollama.embed(model=self.model, input=texts)
+            return resp["embeddings"]
+
+        resp = self.client.embeddings.create(input=texts, model=self.model)
+        return [item.embedding for item in sorted(resp.data, key=lambda item: item.index)]
+
+    def _to_result(self, embedding: 'np.ndarray') -> EmbeddingResult:
+        """Wrap a raw vector in a successful EmbeddingResult."""
+        if self.normalize:
+            embedding = _normalize(embedding)
+
+        return EmbeddingResult(
+            embedding=embedding,
+            model=self.model,
+            provider=self.provider,
+            dimensions=embedding.shape[0],
+            success=True,
+            normalized=self.normalize
+        )
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    async def agenerate(self, text: str) -> EmbeddingResult:
+        """
+        Generate embedding for text without blocking the event loop.
+
+        Same results as generate(), using the provider's async client.
+
+        Example:
+            >>> result = await generator.agenerate("Hello world")
+        """
+        try:
+            embedding = await self._aembed_with_backoff(text)
+            return self._to_result(embedding)
+        except Exception as e:
+            logger.error(f"Error generating embedding: {e}")
+            return EmbeddingResult(
+                embedding=None,
+                model=self.model,
+                provider=self.provider,
+                success=False,
+                error=str(e)
+            )
+
+    async def agenerate_batch(
+        self,
+        texts: List[str],
+        max_concurrency: Optional[int] = None
+    ) -> List[EmbeddingResult]:
+        """
+        Generate embeddings for multiple texts concurrently.
+
+        Batches (or single texts, when batching fails or isn't supported)
+        are requested concurrently, at most max_concurrency at a time.
+
+        Args:
+            texts: List of texts to embed
+            max_concurrency: Concurrent requests (default: max_workers)
+
+        Returns:
+            List of EmbeddingResult objects, in input order
+        """
+        texts = list(texts)
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_workers)
+
+        async def one(text: str) -> EmbeddingResult:
+            async with semaphore:
+                return await self.agenerate(text)
+
+        async def each(chunk: List[str]) -> List[EmbeddingResult]:
+            return list(await asyncio.gather(*(one(text) for text in chunk)))
+
+        batch_size = self.MAX_BATCH.get(self.provider)
+        if not batch_size:
+            return await each(texts)
+
+        async def batch(chunk: List[str]) -> List[EmbeddingResult]:
+            try:
+                async with semaphore:
+                    vectors = await self._aembed_many(chunk)
+                if len(vectors) != len(chunk):
+                    raise ValueError(
+                        f"Expected {len(chunk)} embeddings, got {len(vectors)}"
+                    )
+            except Exception as e:
+                logger.warning(f"Batch embedding failed, retrying individually: {e}")
+                return await each(chunk)
+            return [self._to_result(np.array(vector, dtype=np.float32)) for vector in vectors]
+
+        chunks = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+        results: List[EmbeddingResult] = []
+        for chunk_results in await asyncio.gather(*(batch(chunk) for chunk in chunks)):
+            results.extend(chunk_results)
+        return results
+
+    def _get_async_client(self) -> Any:
+        """
+        Async provider client for the running event loop.
+
+        Async clients hold connections bound to the loop they were first used
+        on, so a new client is created whenever the loop changes (e.g. one
+        asyncio.run() per call on a shared generator).
+        """
+        loop = asyncio.get_running_loop()
+        cached = self._aclient
+        if cached is not None and cached[0] is loop:
+            return cached[1]
+        if self.provider == "ollama":
+            client = ollama.AsyncClient()
+        elif self.provider == "openai":
+            client = AsyncOpenAI(api_key=self.api_key)
+        else:
+            client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        self._aclient = (loop, client)
+        return client
+
+    async def _aembed_with_backoff(self, text: str) -> 'np.ndarray':
+        """Async counterpart of _embed_with_backoff."""
+        config = RATE_LIMIT_RETRY
+        for attempt in range(config.max_attempts):
+            try:
+                return await self._aembed_one(text)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt >= config.max_attempts - 1:
+                    raise
+                sleep_time = config.compute_delay(attempt)
+                logger.warning(f"Embedding rate limited, retrying in {sleep_time:.2f}s")
+                await asyncio.sleep(sleep_time)
+        raise RuntimeError("Embedding retry loop exited without a result")
+
+    async def _aembed_one(self, text: str) -> 'np.ndarray':
+        """Async counterpart of _embed_one."""
+        client = self._get_async_client()
+        if self.provider == "ollama":
+            resp = await client.embed(model=self.model, input=text)
+            return _single_vector(resp["embeddings"])
+
+        resp = await client.embeddings.create(input=text, model=self.model)
+        return np.array(resp.data[0].embedding, dtype=np.float32)
+
+    async def _aembed_many(self, texts: List[str]) -> List[List[float]]:
+        """Async counterpart of _embed_many."""
+        client = self._get_async_client()
+        if self.provider == "ollama":
+            resp = await client.embed(model=self.model, input=texts)
+            return resp["embeddings"]
+
+        resp = await client.embeddings.create(input=texts, model=self.model)
+        return [item.embedding for item in sorted(resp.data, key=lambda item: item.index)]
+
+
+# ============================================================================
+# Approximate Nearest Neighbour Index
+# ============================================================================
+
+# Below this many candidates an exhaustive scan beats querying an HNSW index
+ANN_MIN_CANDIDATES = 4096
+
+# Candidate elements (N * D) from which the Numba kernel replaces numpy
+NUMBA_MIN_ELEMENTS = 1 << 16
+
+
+class AnnIndex:
+    """
+    HNSW approximate nearest-neighbour index over embeddings (cosine space).
+
+    Build it once, then pass it to find_most_similar() so large candidate
+    sets are searched in roughly O(log N) instead of a full scan.
+
+    Example:
+        >>> index = AnnIndex(dim=768, max_elements=100_000)
+        >>> index.add(candidate_matrix)
+        >>> results = find_most_similar(query, None, texts, top_k=5, index=index)
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        max_elements: int,
+        M: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 50
+    ):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Embedding dimensionality
+            max_elements: Capacity of the index
+            M: Graph links per node (higher is more accurate and larger)
+            ef_construction: Candidate list size while building
+            ef_search: Candidate list size while querying
+
+        Raises:
+            ImportError: If hnswlib is not installed
+        """
+        if not HNSWLIB_AVAILABLE:
+            raise ImportError("hnswlib required. Install with: pip install hnswlib")
+
+        self.dim = dim
+        # hnswlib normalizes vectors itself in cosine space
+        self._index = hnswlib.Index(space="cosine", dim=dim)
+        self._index.init_index(max_elements=max_elements, M=M, ef_construction=ef_construction)
+        self._index.set_ef(ef_search)
+
+    def __len__(self) -> int:
+        return self._index.get_current_count()
+
+    def add(
+        self,
+        vectors: Union[List['np.ndarray'], 'np.ndarray'],
+        ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Add vectors to the index.
+
+        Args:
+            vectors: List of embeddings, or a 2-D array with one per row
+            ids: Integer ids (default: consecutive, starting after the
+                current count); results report these as indexes
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if ids is None:
+            start = len(self)
+            ids = np.arange(start, start + matrix.shape[0])
+        self._index.add_items(matrix, ids)
+
+    def set_ef(self, ef_search: int) -> None:
+        """Set the query-time candidate list size (recall vs speed)."""
+        self._index.set_ef(ef_search)
+
+    def knn_query(self, vector: 'np.ndarray', k: int) -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Find the k nearest vectors.
+
+        Returns:
+            Tuple of (ids, cosine similarities), best match first
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        labels, distances = self._index.knn_query(np.asarray(vector, dtype=np.float32), k=k)
+        # Cosine distance is 1 - similarity
+        return labels[0], 1.0 - distances[0]
+
+    def save_index(self, path: str) -> None:
+        """Persist the index to a file."""
+        self._index.save_index(path)
+
+    @classmethod
+    def load_index(cls, path: str, dim: int, max_elements: int = 0) -> 'AnnIndex':
+        """
+        Load an index saved with save_index().
+
+        Args:
+            path: Index file path
+            dim: Embedding dimensionality
+            max_elements: New capacity (0 keeps the saved capacity)
+        """
+        if not HNSWLIB_AVAILABLE:
+            raise ImportError("hnswlib required. Install with: pip install hnswlib")
+
+        instance = cls.__new__(cls)
+        instance.dim = dim
+        instance._index = hnswlib.Index(space="cosine", dim=dim)
+        instance._index.load_index(path, max_elements=max_elements)
+        return instance
+
 
 # ============================================================================
 # Similarity Functions
@@ -257,7 +745,8 @@ class EmbeddingGenerator:
 def calculate_similarity(
     embedding1: 'np.ndarray',
     embedding2: 'np.ndarray',
-    method: str = "cosine"
+    method: str = "cosine",
+    normalized: bool = False
 ) -> float:
     """
     Calculate similarity between two embeddings.
@@ -266,6 +755,8 @@ def calculate_similarity(
         embedding1: First embedding vector
         embedding2: Second embedding vector
         method: Similarity method (currently only 'cosine' supported)
+        normalized: Both vectors are already unit length (e.g. from
+            EmbeddingGenerator), so cosine is just their dot product
 
     Returns:
         Similarity score (0-1, higher is more similar)
@@ -281,8 +772,12 @@ def calculate_similarity(
         raise ImportError("numpy required. Install with: pip install numpy")
 
     if method == "cosine":
+        embedding1 = _as_float32(embedding1)
+        embedding2 = _as_float32(embedding2)
         # Cosine similarity: dot product / (norm1 * norm2)
-        sim = np.dot(embedding1, embedding2) / (np_norm(embedding1) * np_norm(embedding2))
+        sim = np.dot(embedding1, embedding2)
+        if not normalized:
+            sim = sim / (np_norm(embedding1) * np_norm(embedding2))
         # Convert to Python float if numpy scalar
         return sim.item() if hasattr(sim, "item") else float(sim)
     else:
@@ -291,18 +786,30 @@ def calculate_similarity(
 
 def find_most_similar(
     query_embedding: 'np.ndarray',
-    candidate_embeddings: List['np.ndarray'],
+    candidate_embeddings: Optional[Union[List['np.ndarray'], 'np.ndarray']],
     candidate_texts: Optional[List[str]] = None,
-    top_k: int = 5
+    top_k: int = 5,
+    normalized: bool = False,
+    index: Optional[AnnIndex] = None
 ) -> List[SimilarityResult]:
     """
     Find most similar embeddings to query.
 
+    All scores are computed with a single matrix-vector product, and only
+    the top K are selected (partial sort) and turned into results. When
+    Numba is installed, large unnormalized sets are scored by a compiled
+    kernel that folds the row norms into the dot product. With an
+    AnnIndex, large sets (ANN_MIN_CANDIDATES or more, or when no candidate
+    embeddings are passed) are searched approximately through the index.
+
     Args:
         query_embedding: Query embedding vector
-        candidate_embeddings: List of candidate embeddings
+        candidate_embeddings: List of candidate embeddings, or a 2-D array
+            with one candidate per row
         candidate_texts: Optional list of texts corresponding to candidates
         top_k: Number of top results to return
+        normalized: Query and candidates are already unit length
+        index: Optional prebuilt AnnIndex over the same candidates
 
     Returns:
         List of SimilarityResult objects, sorted by score (descending)
@@ -318,32 +825,127 @@ def find_most_similar(
     if not NUMPY_AVAILABLE:
         raise ImportError("numpy required. Install with: pip install numpy")
 
-    # Calculate similarities
-    similarities = []
-    for i, candidate in enumerate(candidate_embeddings):
-        score = calculate_similarity(query_embedding, candidate)
-        text = candidate_texts[i] if candidate_texts else f"Item {i}"
-        similarities.append(SimilarityResult(
-            text=text,
-            score=score,
-            index=i
-        ))
+    count = 0 if candidate_embeddings is None else len(candidate_embeddings)
+    if top_k <= 0:
+        return []
+
+    if index is not None and (count == 0 or count >= ANN_MIN_CANDIDATES):
+        ids, scores = index.knn_query(query_embedding, top_k)
+        return [
+            SimilarityResult(
+                text=candidate_texts[i] if candidate_texts else f"Item {i}",
+                score=float(score),
+                index=int(i)
+            )
+            for i, score in zip(ids, scores)
+        ]
+
+    if count == 0:
+        return []
+
+    matrix = np.asarray(candidate_embeddings, dtype=np.float32, order="C")
+    query = np.asarray(query_embedding, dtype=np.float32)
+    if normalized:
+        scores = matrix @ query
+    elif NUMBA_AVAILABLE and matrix.size >= NUMBA_MIN_ELEMENTS:
+        # One compiled pass instead of a normalized copy of the matrix
+        scores = _cosine_scores_numba(_normalize(query), matrix)
+    else:
+        row_norms = np_norm(matrix, axis=1, keepdims=True)
+        row_norms[row_norms == 0] = 1.0
+        scores = (matrix / row_norms) @ _normalize(query)
+
+    # Partial sort: only the top K candidates are ordered
+    if top_k < count:
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+    else:
+        top = np.arange(count)
+    top = top[np.argsort(-scores[top], kind="stable")]
+
+    return [
+        SimilarityResult(
+            text=candidate_texts[i] if candidate_texts else f"Item {i}",
+            score=float(scores[i]),
+            index=int(i)
+        )
+        for i in top
+    ]
+
 
-    # Sort by score (descending) and return top K
-    similarities.sort(key=lambda x: x.score, reverse=True)
-    return similarities[:top_k]
+def build_centroid(
+    candidate_embeddings: Union[List['np.ndarray'], 'np.ndarray']
+) -> 'np.ndarray':
+    """
+    Build the mean of the unit-normalized candidates.
+
+    The mean cosine similarity between a query and every candidate equals
+    the query's dot product with this centroid, so a set can be reduced to
+    one vector once and then scored in O(1) with mean_similarity().
+
+    Args:
+        candidate_embeddings: List of candidate embeddings, or a 2-D array
+            with one candidate per row
+
+    Returns:
+        Centroid vector (not itself unit length)
+
+    Example:
+        >>> centroid = build_centroid([np.array([1.0, 0.0]), np.array([0.0, 1.0])])
+        >>> print(centroid)
+        [0.5 0.5]
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy required. Install with: pip install numpy")
+
+    matrix = np.asarray(candidate_embeddings, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[0] == 0:
+        raise ValueError("build_centroid requires a non-empty set of embeddings")
+
+    row_norms = np_norm(matrix, axis=1, keepdims=True)
+    row_norms[row_norms == 0] = 1.0
+    return (matrix / row_norms).mean(axis=0)
+
+
+def mean_similarity(query_embedding: 'np.ndarray', centroid: 'np.ndarray') -> float:
+    """
+    Mean cosine similarity between a query and the set behind a centroid.
+
+    Args:
+        query_embedding: Query embedding vector
+        centroid: Centroid from build_centroid()
+
+    Returns:
+        Mean similarity score over the set
+
+    Example:
+        >>> centroid = build_centroid([np.array([1.0, 0.0]), np.array([0.0, 1.0])])
+        >>> print(mean_similarity(np.array([1.0, 0.0]), centroid))
+        0.5
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy required. Install with: pip install numpy")
+
+    query = _normalize(np.asarray(query_embedding, dtype=np.float32))
+    return float(np.dot(query, centroid))
 
 
 # ============================================================================
 # Vector Serialization
 # ============================================================================
 
-def embedding_to_bytes(embedding: 'np.ndarray') -> bytes:
+# Little-endian float32 scale stored ahead of int8-quantized vectors
+_INT8_SCALE_BYTES = 4
+
+
+def embedding_to_bytes(embedding: 'np.ndarray', dtype: Optional[str] = None) -> bytes:
     """
     Convert embedding to bytes for storage.
 
     Args:
         embedding: Numpy array embedding
+        dtype: Storage format. None writes the array as-is; 'float32' and
+            'float16' cast first ('float16' halves the size); 'int8'
+            quantizes with a per-vector scale (about a quarter of the size)
 
     Returns:
         Bytes representation
@@ -353,11 +955,22 @@ def embedding_to_bytes(embedding: 'np.ndarray') -> bytes:
         >>> blob = embedding_to_bytes(emb)
         >>> print(len(blob))
         12
+        >>> print(len(embedding_to_bytes(emb, dtype="int8")))
+        7
     """
     if not NUMPY_AVAILABLE:
         raise ImportError("numpy required. Install with: pip install numpy")
 
-    return embedding.tobytes()
+    if dtype is None:
+        return embedding.tobytes()
+    if dtype == "int8":
+        peak = float(np.abs(embedding).max()) if embedding.size else 0.0
+        scale = peak / 127 if peak else 1.0
+        quantized = np.round(embedding / scale).astype(np.int8)
+        return np.array([scale], dtype="<f4").tobytes() + quantized.tobytes()
+    if dtype in ("float16", "float32"):
+        return embedding.astype(dtype).tobytes()
+    raise ValueError(f"Unsupported storage dtype: {dtype}. Use 'float32', 'float16', or 'int8'")
 
 
 def bytes_to_embedding(blob: bytes, dtype=None) -> 'np.ndarray':
@@ -366,7 +979,9 @@ def bytes_to_embedding(blob: bytes, dtype=None) -> 'np.ndarray':
 
     Args:
         blob: Bytes representation
-        dtype: Data type (default: np.float32)
+        dtype: Data type (default: np.float32). The names 'float16' and
+            'int8' read blobs written by embedding_to_bytes with that
+            format and return float32 vectors
 
     Returns:
         Numpy array embedding
@@ -382,6 +997,13 @@ def bytes_to_embedding(blob: bytes, dtype=None) -> 'np.ndarray':
 
     if dtype is None:
         dtype = np.float32
+    elif isinstance(dtype, str):
+        if dtype == "int8":
+            scale = np.frombuffer(blob, dtype="<f4", count=1)[0]
+            quantized = np.frombuffer(blob, dtype=np.int8, offset=_INT8_SCALE_BYTES)
+            return quantized.astype(np.float32) * scale
+        if dtype == "float16":
+            return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
 
     return np.frombuffer(blob, dtype=dtype)
 
@@ -390,6 +1012,23 @@ def bytes_to_embedding(blob: bytes, dtype=None) -> 'np.ndarray':
 # Functional Interface (Convenience Functions)
 # ============================================================================
 
+@functools.lru_cache(maxsize=8)
+def _get_generator(
+    provider: str,
+    model: str,
+    api_key: Optional[str],
+    base_url: Optional[str] = None
+) -> EmbeddingGenerator:
+    """
+    Shared EmbeddingGenerator per configuration.
+
+    Reusing the generator keeps its HTTP client (and connection pool) alive
+    across calls. The OpenAI and Ollama clients are thread-safe, so one
+    instance can serve concurrent callers.
+    """
+    return EmbeddingGenerator(provider=provider, model=model, api_key=api_key, base_url=base_url)
+
+
 def generate_embedding(
     text: str,
     model: str = "nomic-embed-text:latest",
@@ -417,7 +1056,7 @@ def generate_embedding(
         >>> print(emb.shape)
         (768,)
     """
-    generator = EmbeddingGenerator(provider=provider, model=model, api_key=api_key)
+    generator = _get_generator(provider, model, api_key)
     result = generator.generate(text)
 
     if not result.success:
@@ -449,7 +1088,7 @@ def generate_batch_embeddings(
         >>> print(len(embeddings))
         2
     """
-    generator = EmbeddingGenerator(provider=provider, model=model, api_key=api_key)
+    generator = _get_generator(provider, model, api_key)
     results = generator.generate_batch(texts)
 
     embeddings = []
@@ -4,6 +4,7 @@ Text processing utilities for cleaning, chunking, and summarising content.
 
 from __future__ import annotations
 
+import functools
 import re
 from collections import Counter
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
@@ -42,6 +43,36 @@ DEFAULT_STOPWORDS = {
 }
 
 
+_WS_RE = re.compile(r"\s+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+# Keyword tokens; runs shorter than three characters are skipped by the regex
+_KEYWORD_RE = re.compile(r"[a-zA-Z0-9']{3,}")
+
+# Smart quotes and non-breaking spaces replaced by normalize_whitespace
+_NORMALIZE_TABLE = str.maketrans({
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u00a0": " ",
+})
+
+
+# Default generate_outline heading pattern and its whole-text equivalents;
+# [^\S\r\n] keeps a bare "##" line from matching across its line break
+_DEFAULT_HEADING = r"^#+\s"
+_MD_HEADING_RE = re.compile(r"^#+[^\S\r\n](.*)$", re.M)
+_FIRST_LINE_RE = re.compile(r"^\s*(\S.*)$", re.M)
+# Line boundaries str.splitlines() honours but re's "^"/"$" don't
+_OTHER_LINE_BREAKS_RE = re.compile(r"\r(?!\n)|[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_heading(pattern: str) -> "re.Pattern[str]":
+    """Compile a generate_outline heading pattern once per distinct pattern."""
+    return re.compile(pattern)
+
+
 def normalize_whitespace(text: str) -> str:
     """
     Collapse repeated whitespace, convert smart quotes, and strip leading/trailing space.
@@ -55,17 +86,7 @@ def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
 
-    replacements = {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-        "\u00a0": " ",
-    }
-    for original, replacement in replacements.items():
-        text = text.replace(original, replacement)
-
-    collapsed = re.sub(r"\s+", " ", text)
+    collapsed = _WS_RE.sub(" ", text.translate(_NORMALIZE_TABLE))
     return collapsed.strip()
 
 
@@ -84,26 +105,30 @@ def split_into_sentences(text: str, max_length: int = 500) -> List[str]:
     if not cleaned:
         return []
 
-    sentence_endings = re.compile(r"(?<=[.!?])\s+")
-    sentences = sentence_endings.split(cleaned)
+    sentences = _SENTENCE_RE.split(cleaned)
     combined: List[str] = []
-    buffer = ""
+    # Sentences in the pending buffer and the length of their " "-joined text
+    buffer: List[str] = []
+    buffer_len = 0
 
     for sentence in sentences:
-        candidate = (buffer + " " + sentence).strip() if buffer else sentence
-        if len(candidate) <= max_length:
-            buffer = candidate
+        candidate_len = buffer_len + 1 + len(sentence) if buffer else len(sentence)
+        if candidate_len <= max_length:
+            buffer.append(sentence)
+            buffer_len = candidate_len
         else:
             if buffer:
-                combined.append(buffer)
+                combined.append(" ".join(buffer))
             if len(sentence) <= max_length:
-                buffer = sentence
+                buffer = [sentence]
+                buffer_len = len(sentence)
             else:
                 combined.extend(_chunk_long_sentence(sentence, max_length))
-                buffer = ""
+                buffer = []
+                buffer_len = 0
 
     if buffer:
-        combined.append(buffer)
+        combined.append(" ".join(buffer))
     return combined
 
 
@@ -127,32 +152,36 @@ def chunk_text(
     """
     sentences = split_into_sentences(text, max_length=sentence_max)
     chunks: List[str] = []
-    current = ""
+    # Sentences in the current chunk and the length of their " "-joined text
+    current: List[str] = []
+    current_len = 0
 
     for sentence in sentences:
-        if len(current) + len(sentence) + 1 <= chunk_size:
-            current = (current + " " + sentence).strip()
+        if current_len + len(sentence) + 1 <= chunk_size:
+            current_len += len(sentence) + (1 if current else 0)
+            current.append(sentence)
         else:
             if current:
-                chunks.append(current)
+                chunks.append(" ".join(current))
             if len(sentence) > chunk_size:
                 chunks.extend(_chunk_long_sentence(sentence, chunk_size))
-                current = ""
+                current = []
+                current_len = 0
             else:
-                current = sentence
+                current = [sentence]
+                current_len = len(sentence)
 
     if current:
-        chunks.append(current)
+        chunks.append(" ".join(current))
 
     if overlap > 0 and len(chunks) > 1:
-        overlapped: List[str] = []
-        for idx, chunk in enumerate(chunks):
-            if idx == 0:
-                overlapped.append(chunk)
-                continue
-            previous = overlapped[-1]
-            overlap_text = previous[-overlap:] if len(previous) > overlap else previous
-            overlapped.append((overlap_text + " " + chunk).strip())
+        # Each chunk is prefixed with the tail of the previously emitted one
+        overlapped: List[str] = [chunks[0]]
+        tail = chunks[0][-overlap:]
+        for chunk in chunks[1:]:
+            emitted = (tail + " " + chunk).strip()
+            overlapped.append(emitted)
+            tail = emitted[-overlap:]
         return overlapped
 
     return chunks
@@ -176,9 +205,9 @@ def extract_keywords(
         List of (keyword, frequency) tuples sorted by frequency then alphabetically.
     """
     stopword_set = set(stopwords or DEFAULT_STOPWORDS)
-    tokens = re.findall(r"[a-zA-Z0-9']+", text.lower())
+    tokens = _KEYWORD_RE.findall(text.lower())
 
-    counts = Counter(token for token in tokens if token not in stopword_set and len(token) > 2)
+    counts = Counter(token for token in tokens if token not in stopword_set)
     most_common = counts.most_common(top_k)
     return most_common
 
@@ -202,11 +231,24 @@ def generate_outline(
     Returns:
         List of outline lines.
     """
-    lines = text.splitlines()
     outline: List[str] = []
-    heading_regex = re.compile(heading_pattern)
-
-    for line in lines:
+    if heading_pattern == _DEFAULT_HEADING and not _OTHER_LINE_BREAKS_RE.search(text):
+        # Stream heading matches instead of materialising every line; only
+        # valid when "\n" (or "\r\n") is the sole line break in the text
+        pos = 0
+        for match in _MD_HEADING_RE.finditer(text):
+            if not outline:
+                _append_first_line(outline, text, pos, match.start(), bullet)
+            depth = match.group(0).count("#")
+            if depth <= max_depth:
+                outline.append(f"{bullet * depth} {match.group(1).strip()}")
+            pos = match.end()
+        if not outline:
+            _append_first_line(outline, text, pos, len(text), bullet)
+        return outline
+
+    heading_regex = _compile_heading(heading_pattern)
+    for line in text.splitlines():
         if heading_regex.match(line):
             depth = line.count("#")
             if depth <= max_depth:
@@ -219,6 +261,16 @@ def generate_outline(
     return outline
 
 
+def _append_first_line(
+    outline: List[str], text: str, start: int, end: int, bullet: str
+) -> None:
+    """Add the first non-empty line of text[start:end] as a top-level item."""
+    match = _FIRST_LINE_RE.search(text, start, end)
+    if match:
+        # Fallback: infer first non-empty line as top-level heading
+        outline.append(f"{bullet} {match.group(1).strip()}")
+
+
 def _chunk_long_sentence(sentence: str, max_length: int) -> List[str]:
     """Chunk a single sentence that exceeds the maximum length."""
     words = sentence.split()
@@ -13,6 +13,11 @@ from typing import Any, Callable, Dict, Optional
 
 from flask import Request, current_app, request
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 __all__ = [
     "get_bearer_token",
     "require_api_token",
@@ -66,14 +71,11 @@ def generate_signed_token(
     """
     data = dict(payload)
     data["exp"] = int(time.time()) + expires_in
-    serialized = json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    serialized = _serialize_payload(data)
     signature = hmac.new(secret.encode("utf-8"), serialized, hashlib.sha256).digest()
-    token = (
-        base64.urlsafe_b64encode(serialized).rstrip(b"=").decode("utf-8")
-        + "."
-        + base64.urlsafe_b64encode(signature).rstrip(b"=").decode("utf-8")
-    )
-    return token
+    data_part = base64.urlsafe_b64encode(serialized).rstrip(b"=")
+    signature_part = base64.urlsafe_b64encode(signature).rstrip(b"=")
+    return b".".join((data_part, signature_part)).decode("ascii")
 
 
 def verify_signed_token(token: str, secret: str) -> Dict[str, Any]:
@@ -100,6 +102,17 @@ def verify_signed_token(token: str, secret: str) -> Dict[str, Any]:
     return payload
 
 
+def _serialize_payload(data: Dict[str, Any]) -> bytes:
+    """Compact, key-sorted JSON for signing; orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Non-str keys or oversized ints: let the stdlib handle them
+            pass
+    return json.dumps(data, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
 def _default_validator(token: str) -> bool:
     expected = current_app.config.get("WEB_API_TOKEN")
     return bool(expected) and hmac.compare_digest(expected, token)
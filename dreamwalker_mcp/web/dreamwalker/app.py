@@ -1,12 +1,13 @@
 """Dreamwalker Flask application factory."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
-from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from flask import Flask
 
@@ -36,21 +37,47 @@ DEFAULT_ORCHESTRATORS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def load_orchestrators() -> Dict[str, Dict[str, Any]]:
-    """Load orchestrator metadata from defaults and optional JSON overrides."""
-    orchestrators: Dict[str, Dict[str, Any]] = deepcopy(DEFAULT_ORCHESTRATORS)
-    raw = os.getenv("DREAMWALKER_ORCHESTRATORS")
-    if not raw:
-        return orchestrators
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
-        LOGGER.warning("Invalid DREAMWALKER_ORCHESTRATORS JSON; using defaults")
-        return orchestrators
-    overrides = _parse_orchestrator_payload(payload)
-    if overrides:
-        orchestrators.update(overrides)
-    return orchestrators
+def load_orchestrators() -> Mapping[str, Mapping[str, Any]]:
+    """
+    Load orchestrator metadata from defaults and optional JSON overrides.
+
+    The result is cached per DREAMWALKER_ORCHESTRATORS value and shared by
+    every caller, so it is returned as a read-only view (nested dicts are
+    mapping proxies and lists are tuples); copy it before making changes.
+    """
+    return _load_orchestrators_cached(os.getenv("DREAMWALKER_ORCHESTRATORS"))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_orchestrators_cached(raw: str | None) -> Mapping[str, Mapping[str, Any]]:
+    """Parse and merge overrides once per distinct DREAMWALKER_ORCHESTRATORS value."""
+    orchestrators: Dict[str, Dict[str, Any]] = dict(DEFAULT_ORCHESTRATORS)
+    if raw:
+        try:
+            payload = json.loads(raw)
+        except json.JSONDecodeError:
+            LOGGER.warning("Invalid DREAMWALKER_ORCHESTRATORS JSON; using defaults")
+        else:
+            orchestrators.update(_parse_orchestrator_payload(payload))
+    return _freeze(orchestrators)
+
+
+def _freeze(value: Any) -> Any:
+    """Return a read-only copy of parsed JSON: dicts become proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen (or plain) JSON-like value."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
 
 
 def _parse_orchestrator_payload(payload: Any) -> Dict[str, Dict[str, Any]]:
@@ -128,7 +155,8 @@ def create_app(config: Dict[str, Any] | None = None) -> Flask:
     if config:
         app.config.update(config)
 
-    active_orchestrators = dict(app.config.get("ORCHESTRATORS", {}))
+    # MCPClient keeps (and may edit) its own copy of the orchestrator map
+    active_orchestrators = _thaw(app.config.get("ORCHESTRATORS", {}))
 
     app.mcp_client = MCPClient(
         base_url=app.config["MCP_BASE_URL"],
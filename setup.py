@@ -72,6 +72,9 @@ setup(
             "opentelemetry-sdk>=1.20.0",
         ],
 
+        # Faster JSON serialization
+        "speedups": ["orjson>=3.6.0"],
+
         # All optional dependencies
         "all": [
             "anthropic>=0.18.0",
@@ -91,6 +94,7 @@ setup(
             "markdown>=3.5.0",
             "opentelemetry-api>=1.20.0",
             "opentelemetry-sdk>=1.20.0",
+            "orjson>=3.6.0",
         ],
     },
     entry_points={
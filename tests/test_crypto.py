@@ -0,0 +1,88 @@
+"""
+Test HMAC signing, key derivation, and Fernet helpers
+"""
+import hashlib
+import hmac
+
+import pytest
+
+from dreamwalker_mcp.utils import crypto
+from dreamwalker_mcp.utils.crypto import (
+    derive_key,
+    derive_key_raw,
+    generate_hmac,
+    verify_hmac,
+)
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512", "sha1"])
+def test_generate_hmac_matches_stdlib(algorithm):
+    """Test signatures match a freshly keyed hmac.new()"""
+    expected = hmac.new(b"secret", b"message", algorithm).hexdigest()
+
+    assert generate_hmac("message", "secret", algorithm) == expected
+
+
+def test_verify_hmac():
+    """Test verification accepts valid signatures and rejects everything else"""
+    signature = generate_hmac("message", "secret")
+
+    assert verify_hmac("message", "secret", signature)
+    assert verify_hmac("message", "secret", signature.upper())
+    assert not verify_hmac("message", "other", signature)
+    assert not verify_hmac("other", "secret", signature)
+    assert not verify_hmac("message", "secret", signature[:-2])
+    assert not verify_hmac("message", "secret", "zz" * 32)
+    assert not verify_hmac("message", "secret", " " + signature[1:])
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512", "sha1", "md5"])
+def test_derive_key_matches_pbkdf2_hmac(algorithm):
+    """Test derived keys equal hashlib.pbkdf2_hmac for the same inputs"""
+    salt = bytes(range(16))
+    expected = hashlib.pbkdf2_hmac(algorithm, b"password", salt, 1000, dklen=24)
+
+    key_hex, salt_hex = derive_key(
+        "password", salt=salt.hex(), iterations=1000, length=24, algorithm=algorithm
+    )
+    key, raw_salt = derive_key_raw(
+        b"password", salt=salt, iterations=1000, length=24, algorithm=algorithm
+    )
+
+    assert key_hex == expected.hex()
+    assert salt_hex == salt.hex()
+    assert (key, raw_salt) == (expected, salt)
+
+
+def test_derive_key_generates_salt():
+    """Test a random salt is generated and returned when none is given"""
+    _, salt_one = derive_key("password", iterations=1)
+    _, salt_two = derive_key("password", iterations=1)
+
+    assert len(bytes.fromhex(salt_one)) == 16
+    assert salt_one != salt_two
+
+
+def test_encrypt_many_round_trip():
+    """Test batch encryption round-trips and matches single-item decryption"""
+    if not crypto._FERNET_AVAILABLE:
+        pytest.skip("cryptography not installed")
+    key = crypto.generate_symmetric_key()
+    texts = ["alpha", "", "ünïcode", "alpha"]
+
+    tokens = crypto.encrypt_many(texts, key)
+
+    assert len(tokens) == len(texts)
+    assert tokens[0] != tokens[3]
+    assert crypto.decrypt_many(tokens, key) == texts
+    assert [crypto.decrypt_text(token, key) for token in tokens] == texts
+
+
+def test_decrypt_many_rejects_wrong_key():
+    """Test tokens can't be decrypted with a different key"""
+    if not crypto._FERNET_AVAILABLE:
+        pytest.skip("cryptography not installed")
+    tokens = crypto.encrypt_many(["secret"], crypto.generate_symmetric_key())
+
+    with pytest.raises(Exception):
+        crypto.decrypt_many(tokens, crypto.generate_symmetric_key())
@@ -0,0 +1,106 @@
+"""
+Test shared data clients and parallel call bundles in DataToolModuleBase
+"""
+import threading
+
+import pytest
+
+from dreamwalker_mcp.tools import data_tool_base
+from dreamwalker_mcp.tools.data_tool_base import DataToolModuleBase
+
+
+class FakeFactory:
+    """Stands in for DataFetchingFactory, recording every client it builds."""
+
+    created = []
+
+    @classmethod
+    def create_client(cls, source_name, **kwargs):
+        client = object()
+        cls.created.append((source_name, kwargs.get("api_key"), client))
+        return client
+
+
+class SourceTool(DataToolModuleBase):
+    """Minimal data tool for the 'fake' source."""
+
+    name = "fake_data"
+    source_name = "fake"
+    api_key_name = "fake"
+
+    def build_schemas(self):
+        return []
+
+
+@pytest.fixture(autouse=True)
+def fake_factory(monkeypatch):
+    """Route client creation through FakeFactory with an empty shared cache."""
+    monkeypatch.setattr(data_tool_base, "DataFetchingFactory", FakeFactory)
+    monkeypatch.setattr(data_tool_base, "_SHARED_CLIENTS", {})
+    FakeFactory.created = []
+    return FakeFactory
+
+
+def test_clients_shared_by_source_and_key():
+    """Test instances with the same source and key share one client"""
+    first = SourceTool({"api_key": "k1"})._get_client()
+    second = SourceTool({"api_key": "k1"})._get_client()
+    other = SourceTool({"api_key": "k2"})._get_client()
+
+    assert first is second
+    assert other is not first
+    created = [(source, key) for source, key, _ in FakeFactory.created]
+    assert created == [("fake", "k1"), ("fake", "k2")]
+    assert set(data_tool_base._SHARED_CLIENTS) == {("fake", "k1"), ("fake", "k2")}
+
+
+def test_reset_client_rebuilds_shared_client():
+    """Test reset_client drops the shared entry so the next call builds a new client"""
+    tool = SourceTool({"api_key": "k1"})
+    other = SourceTool({"api_key": "k2"})
+    first = tool._get_client()
+    other_client = other._get_client()
+
+    tool.reset_client()
+    rebuilt = tool._get_client()
+
+    assert rebuilt is not first
+    assert SourceTool({"api_key": "k1"})._get_client() is rebuilt
+    assert other._get_client() is other_client
+    assert len(FakeFactory.created) == 3
+
+
+def test_reset_client_without_client():
+    """Test resetting a tool that never built a client is a no-op"""
+    SourceTool({"api_key": "k1"}).reset_client()
+
+    assert data_tool_base._SHARED_CLIENTS == {}
+
+
+def test_run_parallel_collects_results_and_errors():
+    """Test results are keyed by call and failures are reported per call"""
+    def fail():
+        raise ValueError("boom")
+
+    results = DataToolModuleBase._run_parallel({"a": lambda: 1, "b": fail, "c": lambda: [3]})
+
+    assert results == {"a": 1, "b": {"error": "boom"}, "c": [3]}
+
+
+def test_run_parallel_empty():
+    """Test an empty bundle returns without starting a pool"""
+    assert DataToolModuleBase._run_parallel({}) == {}
+
+
+def test_run_parallel_caps_threads():
+    """Test large bundles never use more than _MAX_PARALLEL_CALLS threads"""
+    threads = set()
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            threads.add(threading.current_thread().name)
+
+    DataToolModuleBase._run_parallel({i: call for i in range(50)})
+
+    assert 1 <= len(threads) <= data_tool_base._MAX_PARALLEL_CALLS
@@ -0,0 +1,141 @@
+"""
+Test schema validation, compiled schemas, field checks, and type coercion
+"""
+import pytest
+
+from dreamwalker_mcp.utils.data_validation import (
+    ValidationError,
+    coerce_types,
+    compile_schema,
+    ensure_fields,
+    validate_choices,
+    validate_compiled,
+    validate_schema,
+)
+
+PERSON_SCHEMA = {
+    "type": "object",
+    "required": ["name", "age"],
+    "properties": {
+        "name": {"type": "string", "minLength": 2, "maxLength": 10},
+        "age": {"type": "integer", "minimum": 0, "maximum": 150},
+        "role": {"type": "string", "enum": ["admin", "user"]},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "score": {"type": "number"},
+        "address": {
+            "type": "object",
+            "required": ["city"],
+            "properties": {"city": {"type": "string"}},
+        },
+    },
+}
+
+CASES = [
+    {"name": "Ada", "age": 36},
+    {"name": "Ada", "age": 36, "role": "admin", "tags": ["x", "y"], "score": 1.5},
+    {"name": "A", "age": -1},
+    {"name": "A" * 20, "age": 200, "role": "root"},
+    {"age": "old"},
+    {"name": "Ada", "age": True, "score": False},
+    {"name": "Ada", "age": 1, "tags": ["ok", 3, None]},
+    {"name": "Ada", "age": 1, "address": {}},
+    {"name": "Ada", "age": 1, "address": {"city": 5}},
+    {"name": "Ada", "age": 1, "role": ["unhashable"]},
+    [],
+    "not an object",
+    None,
+]
+
+
+def test_strings_are_not_treated_as_arrays():
+    """Test strings fail array checks and are never walked item by item"""
+    assert validate_schema("abc", {"type": "array"}) == ["root: expected array, got str"]
+    assert validate_schema("abc", {"items": {"type": "boolean"}}) == []
+    assert validate_schema(("x", 1), {"type": "array", "items": {"type": "string"}}) == [
+        "root[1]: expected string, got int"
+    ]
+
+
+def test_reports_every_error_in_one_walk():
+    """Test errors from every property are collected in schema order"""
+    errors = validate_schema({"name": "A", "age": -1, "role": "root"}, PERSON_SCHEMA)
+
+    assert len(errors) == 3
+    assert [error.split(":")[0] for error in errors] == ["root.name", "root.age", "root.role"]
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_compiled_matches_validate_schema(data):
+    """Test compiled validation reports exactly the same errors"""
+    compiled = compile_schema(PERSON_SCHEMA)
+
+    assert validate_compiled(data, compiled) == validate_schema(data, PERSON_SCHEMA)
+
+
+def test_compile_schema_is_cached():
+    """Test equal schemas compile to the same object"""
+    copy = {**PERSON_SCHEMA, "properties": dict(PERSON_SCHEMA["properties"])}
+
+    assert compile_schema(copy) is compile_schema(PERSON_SCHEMA)
+
+
+@pytest.mark.parametrize("validate", [
+    lambda data, **kw: validate_schema(data, PERSON_SCHEMA, **kw),
+    lambda data, **kw: validate_compiled(data, compile_schema(PERSON_SCHEMA), **kw),
+])
+def test_max_errors(validate):
+    """Test max_errors stops after the requested number of errors"""
+    data = {"name": "A" * 20, "age": 200, "role": "root"}
+    all_errors = validate(data)
+    assert len(all_errors) == 3
+
+    assert validate(data, max_errors=1) == all_errors[:1]
+    assert validate(data, max_errors=2) == all_errors[:2]
+    assert validate(data, max_errors=10) == all_errors
+    assert validate({"name": "Ada", "age": 1}, max_errors=1) == []
+
+
+def test_error_paths():
+    """Test errors name the nested path that failed"""
+    errors = validate_schema({"name": "Ada", "age": 1, "tags": ["ok", 3]}, PERSON_SCHEMA)
+
+    assert len(errors) == 1
+    assert "root.tags[1]" in errors[0]
+
+
+@pytest.mark.parametrize("choices", [
+    ("admin", "user"),
+    ["admin", "user"],
+    {"admin", "user"},
+    frozenset(["admin", "user"]),
+])
+def test_validate_choices(choices):
+    """Test choice checks behave the same for every container type"""
+    validate_choices({"role": "admin"}, "role", choices)
+    validate_choices({}, "role", choices)
+
+    with pytest.raises(ValidationError):
+        validate_choices({"role": "root"}, "role", choices)
+    with pytest.raises(ValidationError):
+        validate_choices({"role": ["admin"]}, "role", choices)
+    with pytest.raises(ValidationError):
+        validate_choices({}, "role", choices, allow_none=False)
+
+
+def test_ensure_fields_lists_missing_fields_in_order():
+    """Test missing and empty fields are reported in the order requested"""
+    ensure_fields({"a": 0, "b": "x"}, ["a", "b"])
+
+    with pytest.raises(ValidationError, match="Missing required fields: c, a"):
+        ensure_fields({"a": "", "b": "x"}, ["c", "b", "a"])
+
+
+def test_coerce_types_copies_on_write():
+    """Test coercion leaves the input untouched and skips unchanged values"""
+    data = {"count": "3", "ratio": 0.5, "name": "x"}
+
+    result = coerce_types(data, {"count": int, "ratio": float})
+
+    assert result == {"count": 3, "ratio": 0.5, "name": "x"}
+    assert data["count"] == "3"
+    assert coerce_types({"ratio": 0.5}, {"ratio": float}) == {"ratio": 0.5}
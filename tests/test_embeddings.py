@@ -0,0 +1,191 @@
+"""
+Test embedding generation, similarity search, and vector serialization
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("openai")
+
+from dreamwalker_mcp.utils import embeddings
+from dreamwalker_mcp.utils.embeddings import (
+    EmbeddingGenerator,
+    bytes_to_embedding,
+    embedding_to_bytes,
+    find_most_similar,
+)
+
+
+def fake_vector(text):
+    """Deterministic 4-d vector for a text."""
+    return [float(len(text)), float(text.count("a")), 1.0, -2.0]
+
+
+def fake_response(texts):
+    """OpenAI-style embeddings response, returned out of index order."""
+    data = [
+        SimpleNamespace(index=i, embedding=fake_vector(text))
+        for i, text in enumerate(texts)
+    ]
+    return SimpleNamespace(data=list(reversed(data)))
+
+
+class FakeEmbeddings:
+    """Sync embeddings endpoint that records requests and fails on 'bad' input."""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, input, model):
+        self.requests.append(input)
+        texts = input if isinstance(input, list) else [input]
+        if "bad" in texts:
+            raise RuntimeError("bad input")
+        return fake_response(texts)
+
+
+@pytest.fixture
+def generator():
+    """Custom-provider generator wired to a fake client."""
+    gen = EmbeddingGenerator(
+        provider="custom", model="fake", api_key="test", base_url="http://localhost"
+    )
+    gen.client = SimpleNamespace(embeddings=FakeEmbeddings())
+    return gen
+
+
+def test_generate_batch_single_request(generator):
+    """Test a batch is embedded in one request, in input order, normalized"""
+    texts = ["a", "banana", "cab"]
+
+    results = generator.generate_batch(texts)
+
+    assert generator.client.embeddings.requests == [texts]
+    assert all(result.success and result.normalized for result in results)
+    for text, result in zip(texts, results):
+        expected = np.array(fake_vector(text), dtype=np.float32)
+        np.testing.assert_allclose(result.embedding, expected / np.linalg.norm(expected), rtol=1e-6)
+
+
+def test_generate_batch_splits_by_max_batch(generator, monkeypatch):
+    """Test batches are capped at MAX_BATCH texts per request"""
+    monkeypatch.setitem(EmbeddingGenerator.MAX_BATCH, "custom", 2)
+
+    generator.generate_batch(["a", "b", "c", "d", "e"])
+
+    assert [len(request) for request in generator.client.embeddings.requests] == [2, 2, 1]
+
+
+def test_generate_batch_falls_back_per_item(generator):
+    """Test a failed batch is retried per text so only the bad text fails"""
+    generator.normalize = False
+
+    results = generator.generate_batch(["good", "bad", "also good"])
+
+    assert [result.success for result in results] == [True, False, True]
+    assert "bad input" in results[1].error
+    np.testing.assert_array_equal(results[2].embedding, fake_vector("also good"))
+
+
+def test_generate_batch_matrix(generator):
+    """Test the matrix form stacks one row per text"""
+    matrix = generator.generate_batch_matrix(["a", "bb", "ccc"])
+
+    assert matrix.shape == (3, 4)
+    assert matrix.dtype == np.float32
+    with pytest.raises(ValueError):
+        generator.generate_batch_matrix(["ok", "bad"])
+
+
+def test_agenerate_across_event_loops(generator, monkeypatch):
+    """Test the async client is rebuilt for each event loop"""
+    loops = []
+
+    class FakeAsyncEmbeddings:
+        async def create(self, input, model):
+            loops.append(asyncio.get_running_loop())
+            return fake_response([input])
+
+    class FakeAsyncOpenAI:
+        def __init__(self, **kwargs):
+            self.loop = asyncio.get_running_loop()
+            self.embeddings = FakeAsyncEmbeddings()
+
+    monkeypatch.setattr(embeddings, "AsyncOpenAI", FakeAsyncOpenAI)
+
+    first = asyncio.run(generator.agenerate("hello"))
+    second = asyncio.run(generator.agenerate("hello"))
+
+    assert first.success and second.success
+    assert loops[0] is not loops[1]
+    assert generator._aclient[1].loop is loops[1]
+
+
+@pytest.mark.parametrize("normalized", [False, True])
+def test_find_most_similar_matches_brute_force(normalized):
+    """Test top-k results match a full sort of cosine similarities"""
+    rng = np.random.default_rng(0)
+    candidates = rng.normal(size=(200, 16)).astype(np.float32)
+    query = rng.normal(size=16).astype(np.float32)
+    if normalized:
+        candidates /= np.linalg.norm(candidates, axis=1, keepdims=True)
+        query /= np.linalg.norm(query)
+
+    results = find_most_similar(query, candidates, top_k=10, normalized=normalized)
+
+    scores = candidates @ query / (np.linalg.norm(candidates, axis=1) * np.linalg.norm(query))
+    expected = np.argsort(-scores, kind="stable")[:10]
+    assert [result.index for result in results] == list(expected)
+    np.testing.assert_allclose([result.score for result in results], scores[expected], rtol=1e-5)
+
+
+def test_find_most_similar_edge_cases():
+    """Test texts, top_k larger than the set, and empty inputs"""
+    candidates = [np.array([1.0, 0.0]), np.array([0.0, 1.0]), np.array([0.0, 0.0])]
+
+    results = find_most_similar(np.array([1.0, 0.1]), candidates, ["x", "y", "zero"], top_k=10)
+
+    assert [result.text for result in results] == ["x", "y", "zero"]
+    assert find_most_similar(np.array([1.0, 0.0]), [], top_k=3) == []
+    assert find_most_similar(np.array([1.0, 0.0]), candidates, top_k=0) == []
+
+
+def test_float16_round_trip():
+    """Test float16 storage halves the size and round-trips closely"""
+    vector = np.random.default_rng(1).normal(size=64).astype(np.float32)
+
+    blob = embedding_to_bytes(vector, dtype="float16")
+    restored = bytes_to_embedding(blob, dtype="float16")
+
+    assert len(blob) == 128
+    assert restored.dtype == np.float32
+    np.testing.assert_allclose(restored, vector, rtol=1e-3, atol=1e-3)
+
+
+def test_int8_round_trip():
+    """Test int8 storage keeps a scale prefix and bounds the error"""
+    vector = np.random.default_rng(2).normal(size=64).astype(np.float32)
+
+    blob = embedding_to_bytes(vector, dtype="int8")
+    restored = bytes_to_embedding(blob, dtype="int8")
+
+    assert len(blob) == 4 + 64
+    assert restored.dtype == np.float32
+    step = np.abs(vector).max() / 127
+    assert np.abs(restored - vector).max() <= step / 2 + 1e-6
+
+
+def test_int8_round_trip_zero_vector():
+    """Test an all-zero vector survives int8 quantization"""
+    restored = bytes_to_embedding(embedding_to_bytes(np.zeros(8, dtype=np.float32), "int8"), "int8")
+
+    np.testing.assert_array_equal(restored, np.zeros(8))
+
+
+def test_default_bytes_round_trip():
+    """Test the default float32 format is lossless"""
+    vector = np.arange(5, dtype=np.float32)
+
+    np.testing.assert_array_equal(bytes_to_embedding(embedding_to_bytes(vector)), vector)
@@ -0,0 +1,287 @@
+"""
+Test tool module helpers: SWR caching, image loading, and JSON encoding
+"""
+import base64
+import contextlib
+import io
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+from dreamwalker_mcp.tools import module_base
+from dreamwalker_mcp.tools.module_base import (
+    ToolModuleBase,
+    dumps_bytes,
+    load_image_payload,
+    swr_cache,
+)
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+class CountingTool(ToolModuleBase):
+    """Tool module whose listing method counts calls and can fail on demand."""
+
+    name = "counting"
+
+    def initialize(self):
+        self.tool_schemas = []
+        self.calls = 0
+        self.results = []
+
+    @swr_cache(ttl=3600, stale_ttl=86400)
+    def list_things(self):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    @swr_cache(ttl=0, stale_ttl=86400)
+    def list_stale(self):
+        self.calls += 1
+        return self.results.pop(0)
+
+
+def wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_swr_cache_returns_fresh_value():
+    """Test fresh results are served from the cache"""
+    tool = CountingTool()
+    tool.results = [{"items": [1]}, {"items": [2]}]
+
+    assert tool.list_things() == {"items": [1]}
+    assert tool.list_things() == {"items": [1]}
+    assert tool.calls == 1
+
+
+def test_swr_cache_skips_error_results():
+    """Test {'error': ...} results are returned but not cached"""
+    tool = CountingTool()
+    tool.results = [{"error": "down"}, {"items": [1]}]
+
+    assert tool.list_things() == {"error": "down"}
+    assert tool.list_things() == {"items": [1]}
+    assert tool.list_things() == {"items": [1]}
+    assert tool.calls == 2
+
+
+def test_swr_cache_does_not_cache_exceptions():
+    """Test a raising call propagates and the next call retries"""
+    tool = CountingTool()
+    tool.results = [RuntimeError("boom"), {"items": [1]}]
+
+    with pytest.raises(RuntimeError):
+        tool.list_things()
+    assert tool.list_things() == {"items": [1]}
+
+
+def test_swr_cache_refreshes_stale_value_in_background():
+    """Test stale values are served while a background refresh runs"""
+    tool = CountingTool()
+    tool.results = [{"v": 1}, {"v": 2}]
+
+    assert tool.list_stale() == {"v": 1}
+    # Stale: old value comes back immediately, refresh happens behind it
+    assert tool.list_stale() == {"v": 1}
+    assert wait_for(lambda: tool.calls == 2 and not tool._swr_entries["list_stale"][2])
+    tool.results = [{"v": 3}]
+    assert tool.list_stale() == {"v": 2}
+
+
+def test_swr_cache_keeps_stale_value_on_error_refresh():
+    """Test an error result from a background refresh keeps the old value"""
+    tool = CountingTool()
+    tool.results = [{"v": 1}, {"error": "down"}]
+
+    tool.list_stale()
+    assert tool.list_stale() == {"v": 1}
+    assert wait_for(lambda: tool.calls == 2 and not tool._swr_entries["list_stale"][2])
+    assert tool._swr_entries["list_stale"][0] == {"v": 1}
+
+
+def test_load_image_payload_reads_file(tmp_path):
+    """Test image files are base64-encoded with a sniffed media type"""
+    image = tmp_path / "pixel.png"
+    image.write_bytes(PNG_BYTES)
+
+    data, media_type = load_image_payload(str(image))
+
+    assert base64.b64decode(data) == PNG_BYTES
+    assert media_type == "image/png"
+
+
+def test_load_image_payload_sees_file_changes(tmp_path):
+    """Test a rewritten file is re-read rather than served from cache"""
+    image = tmp_path / "image.bin"
+    image.write_bytes(PNG_BYTES)
+    load_image_payload(str(image))
+
+    image.write_bytes(b"GIF89a" + b"\x00" * 32)
+    data, media_type = load_image_payload(str(image))
+
+    assert media_type == "image/gif"
+    assert base64.b64decode(data).startswith(b"GIF89a")
+
+
+@pytest.mark.parametrize("value", [
+    base64.b64encode(PNG_BYTES).decode("ascii"),
+    "iVBORw0KGgo/nested/looking+data==",
+    "data:image/png;base64,AAAA",
+    "A" * 5000,
+])
+def test_load_image_payload_passes_base64_through(value):
+    """Test strings that don't name a file are returned unchanged"""
+    assert load_image_payload(value) == (value, None)
+
+
+def test_load_image_payload_rejects_directory(tmp_path):
+    """Test a directory path raises instead of being sent as base64"""
+    with pytest.raises(IsADirectoryError):
+        load_image_payload(str(tmp_path))
+
+
+def test_dumps_bytes_handles_wide_ints():
+    """Test values orjson rejects still serialize via the stdlib"""
+    payload = {"big": 2 ** 70, "items": [1, 2]}
+
+    assert json.loads(dumps_bytes(payload)) == payload
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_bytes_encodes_non_finite_as_null(monkeypatch, use_orjson):
+    """Test NaN and infinities become null with and without orjson"""
+    if not use_orjson:
+        monkeypatch.setattr(module_base, "_ORJSON_AVAILABLE", False)
+    payload = {"result": 1e308 * 10, "items": [float("nan"), 1.5], "pair": (float("-inf"), 2)}
+
+    expected = {"result": None, "items": [None, 1.5], "pair": [None, 2]}
+    assert json.loads(dumps_bytes(payload)) == expected
+
+
+def test_invoke_handler_encodes_dicts_with_dumps_bytes():
+    """Test dict results use the same encoding as dumps_bytes"""
+    content = ToolModuleBase._invoke_handler(lambda a, b: {"result": a * b}, {"a": 1e308, "b": 10})
+
+    assert content == dumps_bytes({"result": None}).decode("utf-8")
+    assert ToolModuleBase._invoke_handler(lambda x: x, "plain") == "plain"
+
+
+class BatchTool(ToolModuleBase):
+    """Tool module with sleeping, failing, and nesting handlers."""
+
+    name = "batch"
+
+    def initialize(self):
+        self.tool_schemas = []
+        self.tool_handlers = {
+            "sleep": self.sleep,
+            "fail": self.fail,
+            "nested": self.nested,
+        }
+        self.barrier = None
+
+    def sleep(self, seconds, value):
+        time.sleep(seconds)
+        return value
+
+    def fail(self, message):
+        raise ValueError(message)
+
+    def nested(self, count):
+        if self.barrier is not None:
+            self.barrier.wait(timeout=2)
+        calls = [tool_call(f"n{i}", "sleep", seconds=0.01, value=str(i)) for i in range(count)]
+        return ",".join(r["content"] for r in self.handle_tool_calls(calls))
+
+
+def tool_call(call_id, name, **arguments):
+    """Build an LLM-style tool call."""
+    return {"id": call_id, "function": {"name": name, "arguments": arguments}}
+
+
+def test_handle_tool_calls_keeps_call_order():
+    """Test responses follow call order, not completion order"""
+    tool = BatchTool()
+    calls = [
+        tool_call("1", "sleep", seconds=0.2, value="slow"),
+        tool_call("2", "sleep", seconds=0, value="fast"),
+        tool_call("3", "sleep", seconds=0.1, value="middle"),
+    ]
+
+    responses = tool.handle_tool_calls(calls)
+
+    assert [r["tool_call_id"] for r in responses] == ["1", "2", "3"]
+    assert [r["content"] for r in responses] == ["slow", "fast", "middle"]
+
+
+def test_handle_tool_calls_reports_errors_per_call():
+    """Test exceptions, unknown tools, and missing function keys only affect their call"""
+    tool = BatchTool()
+    calls = [
+        tool_call("1", "fail", message="boom"),
+        tool_call("2", "missing"),
+        {"id": "3"},
+        tool_call("4", "sleep", seconds=0, value="ok"),
+    ]
+
+    responses = tool.handle_tool_calls(calls)
+
+    assert [(r["name"], r["content"]) for r in responses] == [
+        ("fail", "Error: boom"),
+        ("missing", "Error: Unknown tool 'missing'"),
+        ("unknown", "Error: Unknown tool 'unknown'"),
+        ("sleep", "ok"),
+    ]
+
+
+def test_handle_tool_calls_times_out(monkeypatch):
+    """Test calls still running at the batch deadline are reported as timed out"""
+    monkeypatch.setattr(module_base, "TOOL_CALL_TIMEOUT", 0.1)
+    tool = BatchTool()
+    calls = [
+        tool_call("1", "sleep", seconds=1, value="late"),
+        tool_call("2", "sleep", seconds=0, value="ok"),
+    ]
+
+    responses = tool.handle_tool_calls(calls)
+
+    assert [r["content"] for r in responses] == ["Error: Tool call timed out after 0.1s", "ok"]
+
+
+def test_handle_tool_calls_runs_nested_batches_inline(monkeypatch):
+    """Test batches issued from pool workers don't wait on the busy pool"""
+    # The barrier makes all 8 outer calls occupy every pool worker before
+    # any nested batch starts; the deadline only stops a regression from
+    # hanging the suite.
+    monkeypatch.setattr(module_base, "TOOL_CALL_TIMEOUT", 5)
+    tool = BatchTool()
+    tool.barrier = threading.Barrier(8)
+    calls = [tool_call(str(i), "nested", count=2) for i in range(8)]
+
+    responses = tool.handle_tool_calls(calls)
+
+    assert [r["content"] for r in responses] == ["0,1"] * 8
+
+
+def test_main_writes_to_redirected_stdout(monkeypatch):
+    """Test main() prints compact JSON to text-only stdout replacements"""
+    monkeypatch.setattr(sys, "argv", ["batch", "--tool", "sleep", "--args", '{"seconds": 0, "value": "ok"}'])
+    out = io.StringIO()
+
+    with contextlib.redirect_stdout(out), pytest.raises(SystemExit) as exc:
+        BatchTool.main()
+
+    assert exc.value.code == 0
+    assert json.loads(out.getvalue()) == {"status": "success", "result": "ok"}
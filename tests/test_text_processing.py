@@ -0,0 +1,121 @@
+"""
+Test text chunking and outline generation against reference implementations
+"""
+import random
+import re
+
+import pytest
+
+from dreamwalker_mcp.utils.text_processing import (
+    _chunk_long_sentence,
+    chunk_text,
+    generate_outline,
+    split_into_sentences,
+)
+
+
+def reference_chunk_text(text, chunk_size=1200, overlap=200, sentence_max=500):
+    """Straightforward string-concatenating chunker the optimized one must match."""
+    chunks = []
+    current = ""
+    for sentence in split_into_sentences(text, max_length=sentence_max):
+        if len(current) + len(sentence) + 1 <= chunk_size:
+            current = (current + " " + sentence).strip()
+        else:
+            if current:
+                chunks.append(current)
+            if len(sentence) > chunk_size:
+                chunks.extend(_chunk_long_sentence(sentence, chunk_size))
+                current = ""
+            else:
+                current = sentence
+    if current:
+        chunks.append(current)
+
+    if overlap > 0 and len(chunks) > 1:
+        overlapped = [chunks[0]]
+        for chunk in chunks[1:]:
+            previous = overlapped[-1]
+            overlap_text = previous[-overlap:] if len(previous) > overlap else previous
+            overlapped.append((overlap_text + " " + chunk).strip())
+        return overlapped
+    return chunks
+
+
+def reference_outline(text, max_depth=2, heading_pattern=r"^#+\s", bullet="-"):
+    """Line-by-line outline builder the streaming one must match."""
+    outline = []
+    heading_regex = re.compile(heading_pattern)
+    for line in text.splitlines():
+        if heading_regex.match(line):
+            depth = line.count("#")
+            if depth <= max_depth:
+                outline.append(f"{bullet * depth} {heading_regex.sub('', line).strip()}")
+        elif not outline and line.strip():
+            outline.append(f"{bullet} {line.strip()}")
+    return outline
+
+
+CHUNK_WORDS = ["alpha", "beta", "gamma.", "delta!", "eps?", "\u201cq\u201d", "x" * 40, " ", "\n"]
+
+OUTLINE_PARTS = [
+    "#", "##", "# ", "## x", "### y#z", "\n", "\r\n", "\r", "\x0c", "\x85",
+    "\u2028", " ", "\t", "text", "C# a", "#\t", " # no", "\n\n",
+]
+
+
+def test_chunk_text_matches_reference():
+    """Test chunk_text output matches the reference on random inputs"""
+    rng = random.Random(0)
+    for _ in range(300):
+        text = " ".join(rng.choice(CHUNK_WORDS) for _ in range(rng.randint(0, 200)))
+        kwargs = {
+            "chunk_size": rng.randint(10, 300),
+            "overlap": rng.randint(0, 80),
+            "sentence_max": rng.randint(5, 120),
+        }
+        assert chunk_text(text, **kwargs) == reference_chunk_text(text, **kwargs)
+
+
+def test_chunk_text_overlap():
+    """Test each chunk starts with the tail of the previous one"""
+    text = " ".join(f"Sentence number {i} is here." for i in range(40))
+
+    chunks = chunk_text(text, chunk_size=100, overlap=20)
+
+    assert len(chunks) > 2
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.startswith(previous[-20:].strip())
+
+
+def test_generate_outline_matches_reference():
+    """Test generate_outline output matches the reference on random inputs"""
+    rng = random.Random(1)
+    for _ in range(2000):
+        text = "".join(rng.choice(OUTLINE_PARTS) for _ in range(rng.randint(0, 30)))
+        for max_depth in (0, 1, 2, 5):
+            assert generate_outline(text, max_depth=max_depth) == reference_outline(
+                text, max_depth=max_depth
+            ), repr(text)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("# Title\n## Sub\nbody", ["- Title", "-- Sub"]),
+    ("intro\n\n# Title\n### Deep", ["- intro", "- Title"]),
+    ("# Title\r## Sub\rbody\r", ["- Title", "-- Sub"]),
+    ("intro\u2028# Title", ["- intro", "- Title"]),
+    ("### Deep\nfirst line\n# Top", ["- first line", "- Top"]),
+    ("", []),
+])
+def test_generate_outline_examples(text, expected):
+    """Test outlines for common and mixed line-break inputs"""
+    assert generate_outline(text) == expected
+
+
+def test_generate_outline_custom_pattern():
+    """Test custom heading patterns use the per-line path"""
+    text = "Intro\n== Part ==\n# ignored"
+
+    assert generate_outline(text, heading_pattern=r"^==") == reference_outline(
+        text, heading_pattern=r"^=="
+    )
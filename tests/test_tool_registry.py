@@ -0,0 +1,118 @@
+"""
+Test tool registry registration, module flags, and derived-view caching
+"""
+import pytest
+
+from dreamwalker_mcp.tools.registry import ToolRegistry
+
+
+def make_schema(name):
+    """Build a minimal valid tool schema."""
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": f"{name} tool",
+            "parameters": {"type": "object", "properties": {}},
+        },
+    }
+
+
+@pytest.fixture
+def registry():
+    """Provide an empty registry."""
+    return ToolRegistry()
+
+
+def test_tool_info_shape(registry):
+    """Test tool info holds only the schema, handler, module, and caller metadata"""
+    registry.register_tool("a", make_schema("a"), lambda: None, module_name="mod", owner="me")
+
+    assert set(registry.get_tool("a")) == {"schema", "handler", "module", "owner"}
+
+
+def test_module_enabled_flags(registry):
+    """Test enabling and disabling modules filters tools and schemas"""
+    registry.register_tool("a", make_schema("a"), lambda: None, module_name="one")
+    registry.register_tool("b", make_schema("b"), lambda: None, module_name="two")
+
+    registry.enable_module("two", False)
+    assert list(registry.get_enabled_tools()) == ["a"]
+    assert [s["function"]["name"] for s in registry.get_tool_schemas()] == ["a"]
+    assert not registry.is_module_enabled("two")
+
+    registry.enable_module("two")
+    assert list(registry.get_enabled_tools()) == ["a", "b"]
+    assert registry.is_module_enabled("two")
+
+
+@pytest.mark.parametrize("value, enabled", [
+    (None, False),
+    (0, False),
+    ("", False),
+    ("no", True),
+    (1, True),
+    ([1], True),
+])
+def test_non_bool_enabled_config(registry, value, enabled):
+    """Test module configs accept any truthy/falsy 'enabled' value"""
+    registry.register_tool("a", make_schema("a"), lambda: None, module_name="mod")
+
+    registry.set_module_config("mod", {"enabled": value})
+
+    assert registry.is_module_enabled("mod") is enabled
+    assert ("a" in registry.get_enabled_tools()) is enabled
+    assert registry.get_module_config("mod") == {"enabled": value}
+
+
+def test_module_config_copies_stay_in_sync(registry):
+    """Test mutating passed-in or returned configs cannot desync module flags"""
+    registry.register_tool("a", make_schema("a"), lambda: None, module_name="mod")
+    config = {"enabled": True}
+    registry.set_module_config("mod", config)
+
+    config["enabled"] = False
+    registry.get_module_config("mod")["enabled"] = False
+    registry.get_module_config()["mod"]["enabled"] = False
+
+    assert registry.is_module_enabled("mod")
+    assert registry.get_module_config() == {"mod": {"enabled": True}}
+    assert list(registry.get_enabled_tools()) == ["a"]
+
+
+def test_register_tools_batch(registry):
+    """Test batch registration skips duplicates and invalid schemas"""
+    result = registry.register_tools([
+        ("a", make_schema("a"), lambda: "a", "mod", None),
+        ("b", make_schema("b"), lambda: "b", "mod", {"tags": ["x"]}),
+        ("a", make_schema("a"), lambda: "dup", "mod", None),
+        ("bad", {"type": "function"}, lambda: None, "mod", None),
+    ])
+
+    assert result["registered"] == ["a", "b"]
+    assert list(result["errors"]) == ["bad"]
+    assert registry.get_tool("b")["tags"] == ["x"]
+    assert registry.get_tools_by_module("mod") == ("a", "b")
+    assert registry.get_metrics()["duplicate_tools"] == 1
+
+
+def test_enabled_tools_cache_invalidation(registry):
+    """Test cached enabled views are rebuilt after every mutation"""
+    registry.register_tool("a", make_schema("a"), lambda: None, module_name="mod")
+    first = registry.get_enabled_tools()
+    assert registry.get_enabled_tools() is first
+
+    registry.register_tool("b", make_schema("b"), lambda: None, module_name="mod")
+    assert list(registry.get_enabled_tools()) == ["a", "b"]
+
+    registry.set_module_config("mod", {"enabled": False})
+    assert registry.get_enabled_tools() == {}
+    assert registry.get_tool_schemas() == []
+
+    registry.set_module_config("mod", {"enabled": True})
+    registry.unregister_tool("a")
+    assert list(registry.get_enabled_tools()) == ["b"]
+
+    registry.clear()
+    assert registry.get_enabled_tools() == {}
+    assert registry.get_tool_schemas(enabled_only=False) == []